@@ -8,25 +8,41 @@ import os
 import json
 import logging
 import uuid
-import shutil
+import threading
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 import traceback
 
+try:
+    import fcntl
+except ImportError:  # Windows: manifest updates are serialised per process only
+    fcntl = None
+
 # Load environment variables
 load_dotenv()
 
 app = Flask(__name__)
 app.secret_key = os.getenv('FLASK_SECRET_KEY', 'dev_secret_for_flash')
+# Reject oversized uploads from Content-Length before the body is read
+app.config['MAX_CONTENT_LENGTH'] = int(os.getenv('MAX_UPLOAD_MB', '1024')) * 1024 * 1024
+# Behind Apache (mod_xsendfile) or lighttpd, let the server stream video files.
+# nginx ignores X-Sendfile (it needs X-Accel-Redirect), so keep this off there.
+app.config['USE_X_SENDFILE'] = os.getenv('USE_X_SENDFILE', 'false').lower() in ('true', '1', 'on')
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Threads for independent network calls within a request (Groq scripts, Pexels)
+HTTP_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="http")
+
 # Create videos directory for storing all generated videos
 VIDEOS_DIR = "videos"
 VIDEO_MANIFEST = f"{VIDEOS_DIR}/manifest.json"
 LAYOUTS_CONFIG = "layouts.json"
+# Copy buffer for saving uploads (Werkzeug's default is 16 KB)
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
 
 def ensure_directories():
     """Ensure all required directories exist"""
@@ -128,32 +144,78 @@ def layout_to_video_params(layout_config, video_format='short'):
     
     return params
 
-def load_manifest():
-    """Load video manifest"""
-    if os.path.exists(VIDEO_MANIFEST):
+# Parsed manifest reused until the file changes:
+# ((mtime_ns, size, inode), manifest, {filename: entry}). save_manifest ends
+# with os.replace, so every save gets a new inode even within one mtime tick.
+_MANIFEST_CACHE = None
+
+def _cached_manifest():
+    """Parsed manifest and its filename index, or (None, {}) if unreadable"""
+    global _MANIFEST_CACHE
+    try:
+        st = os.stat(VIDEO_MANIFEST)
+    except OSError:
+        return None, {}
+    key = (st.st_mtime_ns, st.st_size, st.st_ino)
+    if _MANIFEST_CACHE is None or _MANIFEST_CACHE[0] != key:
         try:
             with open(VIDEO_MANIFEST, 'r') as f:
-                return json.load(f)
+                manifest = json.load(f)
         except Exception:
-            return {"videos": []}
-    return {"videos": []}
+            return None, {}
+        # Reversed so the first (newest) entry wins for duplicate filenames
+        by_filename = {v.get("filename"): v for v in reversed(manifest.get("videos", []))}
+        _MANIFEST_CACHE = (key, manifest, by_filename)
+    return _MANIFEST_CACHE[1], _MANIFEST_CACHE[2]
+
+def load_manifest():
+    """Load video manifest, re-reading the file only when it has changed"""
+    manifest, _ = _cached_manifest()
+    if manifest is None:
+        return {"videos": []}
+    # Callers add and remove entries, so each gets its own containers
+    return {**manifest, "videos": list(manifest.get("videos", []))}
+
+def find_manifest_video(filename):
+    """Manifest entry for filename, or None (a dict lookup, not a list scan)"""
+    _, by_filename = _cached_manifest()
+    return by_filename.get(filename)
 
 def save_manifest(manifest):
     """Save video manifest"""
     try:
         # Ensure directory exists
         os.makedirs(VIDEOS_DIR, exist_ok=True)
-        # Write to temp file first, then move (atomic write)
-        temp_path = f"{VIDEO_MANIFEST}.tmp"
+        # Write to a per-writer temp file first, then rename over the manifest
+        # (atomic, and concurrent writers never share a temp file)
+        temp_path = f"{VIDEO_MANIFEST}.{os.getpid()}.{threading.get_ident()}.tmp"
         with open(temp_path, 'w') as f:
             json.dump(manifest, f, indent=2)
-        # Atomic rename
-        shutil.move(temp_path, VIDEO_MANIFEST)
+        os.replace(temp_path, VIDEO_MANIFEST)
         logger.info(f"✓ Manifest saved successfully ({len(manifest.get('videos', []))} videos)")
     except Exception as e:
         logger.error(f"✗ Failed to save manifest: {e}")
         raise
 
+_MANIFEST_LOCK = threading.Lock()
+
+def update_manifest(update):
+    """Load the manifest, apply update(manifest) and save it.
+
+    Serialised across threads by _MANIFEST_LOCK and across worker processes
+    by an flock on a sidecar lock file, so concurrent requests can't
+    overwrite each other's changes.
+    """
+    os.makedirs(VIDEOS_DIR, exist_ok=True)
+    with _MANIFEST_LOCK, open(f"{VIDEO_MANIFEST}.lock", 'a') as lock_file:
+        if fcntl is not None:
+            # Released when lock_file is closed
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        manifest = load_manifest()
+        update(manifest)
+        save_manifest(manifest)
+        return manifest
+
 def add_to_manifest(video_path, headline, description, language):
     """Add video entry to manifest"""
     try:
@@ -162,8 +224,6 @@ def add_to_manifest(video_path, headline, description, language):
             logger.error(f"✗ Video file not found: {video_path}")
             raise FileNotFoundError(f"Video file not found: {video_path}")
         
-        manifest = load_manifest()
-        
         # Get file size with error handling
         try:
             file_size_mb = round(os.path.getsize(video_path) / (1024*1024), 2)
@@ -181,8 +241,7 @@ def add_to_manifest(video_path, headline, description, language):
             "created_at": datetime.now().isoformat(),
             "size_mb": file_size_mb
         }
-        manifest["videos"].insert(0, entry)  # New videos first
-        save_manifest(manifest)
+        update_manifest(lambda manifest: manifest["videos"].insert(0, entry))  # New videos first
         logger.info(f"✓ Added to manifest: {headline} ({file_size_mb} MB)")
         return entry
     except Exception as e:
@@ -315,6 +374,12 @@ def videos_ui_root():
 def inject_year():
     return {'current_year': datetime.now().year}
 
+@app.errorhandler(413)
+def upload_too_large(e):
+    limit_mb = app.config['MAX_CONTENT_LENGTH'] // (1024 * 1024)
+    return jsonify({'error': f'Upload too large (limit {limit_mb} MB)'}), 413
+
+
 # Background management storage helpers
 BACKGROUND_FOLDER = os.path.join(os.getcwd(), 'static', 'backgrounds')
 BACKGROUND_DB = os.path.join(os.getcwd(), 'backgrounds.json')
@@ -357,7 +422,7 @@ def upload_background():
     filename = f"{uuid.uuid4().hex}.{ext}"
     save_path = os.path.join(BACKGROUND_FOLDER, filename)
     try:
-        file.save(save_path)
+        file.save(save_path, buffer_size=UPLOAD_CHUNK_SIZE)
     except Exception as e:
         logger.error(f"Background upload failed: {e}")
         return jsonify({'error': 'Failed to save file'}), 500
@@ -419,37 +484,33 @@ def rss_save_mapping():
         return jsonify({'error': str(e)}), 500
 
 
+def _send_video(filename, **send_kwargs):
+    """Serve a video from its manifest path, falling back to VIDEOS_DIR.
+
+    send_file stats the file itself, so each candidate costs a single stat
+    instead of an exists() check followed by send_file's own stat.
+    """
+    video_entry = find_manifest_video(filename)
+
+    candidates = [video_entry["path"]] if video_entry else []
+    # Fallback to old location for backwards compatibility
+    candidates.append(os.path.join(VIDEOS_DIR, filename))
+    for video_path in candidates:
+        try:
+            return send_file(video_path, mimetype='video/mp4', **send_kwargs)
+        except FileNotFoundError:
+            continue
+    return jsonify({"error": "Video not found"}), 404
+
+
 @app.route("/video/<filename>", methods=["GET"])
 def get_video(filename):
     """Download a specific video"""
     # Validate filename to prevent path traversal
     if ".." in filename or "/" in filename or "\\" in filename:
         return jsonify({"error": "Invalid filename"}), 400
-    
-    # First check if video exists in manifest and use the full path from there
-    manifest = load_manifest()
-    video_entry = next((v for v in manifest["videos"] if v["filename"] == filename), None)
-    
-    if video_entry:
-        video_path = video_entry["path"]
-        if os.path.exists(video_path):
-            return send_file(
-                video_path, 
-                as_attachment=True,
-                download_name=filename,
-                mimetype='video/mp4'
-            )
-    
-    # Fallback to old location for backwards compatibility
-    video_path = os.path.join(VIDEOS_DIR, filename)
-    if os.path.exists(video_path):
-        return send_file(
-            video_path, 
-            as_attachment=True,
-            download_name=filename,
-            mimetype='video/mp4'
-        )
-    return jsonify({"error": "Video not found"}), 404
+
+    return _send_video(filename, as_attachment=True, download_name=filename)
 
 
 @app.route("/preview/<filename>", methods=["GET"])
@@ -458,23 +519,13 @@ def preview_video(filename):
     if ".." in filename or "/" in filename or "\\" in filename:
         return jsonify({"error": "Invalid filename"}), 400
 
-    manifest = load_manifest()
-    video_entry = next((v for v in manifest["videos"] if v["filename"] == filename), None)
-    if video_entry and os.path.exists(video_entry["path"]):
-        return send_file(video_entry["path"], as_attachment=False, mimetype='video/mp4')
-
-    video_path = os.path.join(VIDEOS_DIR, filename)
-    if os.path.exists(video_path):
-        return send_file(video_path, as_attachment=False, mimetype='video/mp4')
-
-    return jsonify({"error": "Video not found"}), 404
+    return _send_video(filename, as_attachment=False)
 
 @app.route("/video/<filename>", methods=["DELETE"])
 def delete_video(filename):
     """Delete a specific video"""
     # First check if video exists in manifest and use the full path from there
-    manifest = load_manifest()
-    video_entry = next((v for v in manifest["videos"] if v["filename"] == filename), None)
+    video_entry = find_manifest_video(filename)
     
     if video_entry:
         video_path = video_entry["path"]
@@ -482,8 +533,7 @@ def delete_video(filename):
             try:
                 os.remove(video_path)
                 # Update manifest
-                manifest["videos"] = [v for v in manifest["videos"] if v["filename"] != filename]
-                save_manifest(manifest)
+                update_manifest(lambda m: m.update(videos=[v for v in m["videos"] if v["filename"] != filename]))
                 return jsonify({"status": "deleted", "filename": filename})
             except Exception as e:
                 logger.warning(f"Failed to delete video {filename}: {e}")
@@ -495,8 +545,7 @@ def delete_video(filename):
         try:
             os.remove(video_path)
             # Update manifest
-            manifest["videos"] = [v for v in manifest["videos"] if v["filename"] != filename]
-            save_manifest(manifest)
+            update_manifest(lambda m: m.update(videos=[v for v in m["videos"] if v["filename"] != filename]))
             return jsonify({"status": "deleted", "filename": filename})
         except Exception as e:
             logger.warning(f"Failed to delete video {filename}: {e}")
@@ -544,7 +593,7 @@ def generate():
             safe_ext = ext if ext in [".jpg", ".jpeg", ".png", ".webp", ".mp4", ".mov", ".avi", ".mkv", ".webm"] else ".bin"
             media_name = f"short_media_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')[:-3]}{safe_ext}"
             uploaded_media_path = os.path.join("uploads", media_name)
-            media_file.save(uploaded_media_path)
+            media_file.save(uploaded_media_path, buffer_size=UPLOAD_CHUNK_SIZE)
             logger.info(f"Saved short-form media upload: {uploaded_media_path}")
         except Exception as e:
             logger.warning(f"Failed to save short-form media upload: {e}")
@@ -675,7 +724,7 @@ def generate_long():
                         ts = datetime.now().strftime('%Y%m%d_%H%M%S_%f')[:-3]
                         outname = f'story_{i}_{ts}_{filename}'
                         outpath = os.path.join('uploads', outname)
-                        f.save(outpath)
+                        f.save(outpath, buffer_size=UPLOAD_CHUNK_SIZE)
                         story_media.append(outpath)
                         logger.info(f'✓ Saved story upload: {outpath}')
                     except Exception as e:
@@ -686,19 +735,6 @@ def generate_long():
             if story_media:
                 green_screen_media = story_media[0]
 
-        # If still no green screen uploaded, attempt Pexels for first story headline
-        if not green_screen_media and stories:
-            logger.info('📸 No green screen uploaded for stories, fetching from Pexels API...')
-            from pexels_helper import fetch_image_from_pexels
-            first_headline = stories[0].get('headline') if isinstance(stories, list) and len(stories) > 0 else None
-            if first_headline:
-                pexels_image = fetch_image_from_pexels(first_headline)
-                if pexels_image:
-                    green_screen_media = pexels_image
-                    logger.info('✓ Using Pexels image as green screen')
-                else:
-                    logger.info('⚠️ Pexels API unavailable or no image found; placeholder will be used')
-
         if not stories:
             return jsonify({"error": "title and description required (or provide stories)"}), 400
         
@@ -714,16 +750,32 @@ def generate_long():
         combined_scripts = []
         total_words = 0
         for s in stories:
-            h = s.get('headline') or ''
-            d = s.get('description') or ''
-            if not h or not d:
+            if not s.get('headline') or not s.get('description'):
                 logger.error('Story missing headline or description')
                 return jsonify({'error': 'Each story requires headline and description'}), 400
-            logger.info(f'Generating script for story: {h[:80]}')
-            script_result = generate_long_script(h, d, language)
+
+        # If still no green screen uploaded, attempt Pexels for first story headline.
+        # The fetch runs in the background while the scripts are generated.
+        pexels_future = None
+        if not green_screen_media:
+            logger.info('📸 No green screen uploaded for stories, fetching from Pexels API...')
+            from pexels_helper import fetch_image_from_pexels
+            pexels_future = HTTP_EXECUTOR.submit(fetch_image_from_pexels, stories[0]['headline'])
+
+        # Stories are independent, so their scripts are requested concurrently
+        def story_script(story):
+            logger.info(f"Generating script for story: {story['headline'][:80]}")
+            return generate_long_script(story['headline'], story['description'], language)
+
+        script_results = list(HTTP_EXECUTOR.map(story_script, stories))
+        for s, script_result in zip(stories, script_results):
+            h = s['headline']
             if not script_result.get('success'):
                 error_msg = script_result.get('error', 'Script generation failed')
                 logger.error(f'Script generation failed for story "{h}": {error_msg}')
+                if pexels_future is not None:
+                    # Drop the image fetch if it hasn't started yet
+                    pexels_future.cancel()
                 return jsonify({ 'status': 'failed', 'stage': 'script_generation', 'error': error_msg }), 400
             piece = script_result.get('script')
             wc = script_result.get('word_count', 0)
@@ -735,6 +787,14 @@ def generate_long():
         word_count = total_words
         logger.info(f'✓ Combined script generated ({word_count} words total)')
 
+        if pexels_future is not None:
+            pexels_image = pexels_future.result()
+            if pexels_image:
+                green_screen_media = pexels_image
+                logger.info('✓ Using Pexels image as green screen')
+            else:
+                logger.info('⚠️ Pexels API unavailable or no image found; placeholder will be used')
+
         # Prepare combined metadata for video (use joined headlines/descriptions)
         try:
             headline = ' | '.join([s.get('headline','') for s in stories if s.get('headline')])
@@ -934,7 +994,6 @@ def test_long():
 
 
 if __name__ == "__main__":
-    ensure_directories()
     ensure_directories()
     # Allow overriding port via PORT or FLASK_PORT environment variables for testing
     try:
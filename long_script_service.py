@@ -8,16 +8,15 @@ Generates 1000-1500 word scripts optimized for YouTube retention with:
 - No emojis or stage directions
 """
 
-import os
 import requests
 from dotenv import load_dotenv
 import logging
 
+from script_service import GROQ_URL, get_groq_session
+
 load_dotenv()
 logger = logging.getLogger(__name__)
 
-API_KEY = os.getenv("GROQ_API_KEY")
-
 
 def generate_long_script(headline, description, language="english"):
     """
@@ -87,12 +86,6 @@ Do not include section headers in the output - write it as a flowing narrative.
 """
 
     try:
-        url = "https://api.groq.com/openai/v1/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {API_KEY}",
-            "Content-Type": "application/json",
-        }
-
         data = {
             "model": "llama-3.3-70b-versatile",
             "messages": [{"role": "user", "content": prompt}],
@@ -101,7 +94,7 @@ Do not include section headers in the output - write it as a flowing narrative.
         }
 
         logger.info("Generating long-form script via Groq API...")
-        response = requests.post(url, headers=headers, json=data, timeout=60)
+        response = get_groq_session().post(GROQ_URL, json=data, timeout=60)
 
         if response.status_code != 200:
             logger.error(f"Groq API error: {response.status_code} - {response.text}")
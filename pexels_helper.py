@@ -1,10 +1,39 @@
 import os
 import logging
 from datetime import datetime
+from threading import Lock
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+PEXELS_API_KEY = os.getenv("PEXELS_API_KEY")
+PEXELS_SEARCH_URL = "https://api.pexels.com/v1/search"
+
+_PEXELS_SESSION = None
+
+# Search keywords -> downloaded image path, so repeated headlines skip the
+# search and download. Oldest entries are dropped past the limit. Shared by
+# Flask request threads, hence the lock.
+_IMAGE_CACHE = {}
+_IMAGE_CACHE_MAX = 256
+_IMAGE_CACHE_LOCK = Lock()
+
+
+def _get_pexels_session():
+    """Shared keep-alive session for the Pexels API and image CDN."""
+    global _PEXELS_SESSION
+    if _PEXELS_SESSION is None:
+        session = requests.Session()
+        # Retry transient failures on the same pooled connection; a final 5xx is
+        # returned rather than raised so the status check below still applies
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504], raise_on_status=False)
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries))
+        session.headers.update({"User-Agent": "GrahakChetna/1.0"})
+        _PEXELS_SESSION = session
+    return _PEXELS_SESSION
+
 
 def fetch_image_from_pexels(headline, dimension=800):
     """Fetch an image from Pexels for the given headline.
@@ -12,7 +41,7 @@ def fetch_image_from_pexels(headline, dimension=800):
     Returns local path or None.
     """
     try:
-        pexels_api_key = os.getenv("PEXELS_API_KEY")
+        pexels_api_key = PEXELS_API_KEY
         if not pexels_api_key:
             logger.warning("PEXELS_API_KEY not set")
             return None
@@ -21,10 +50,16 @@ def fetch_image_from_pexels(headline, dimension=800):
         if not keywords:
             return None
 
-        headers = {"Authorization": pexels_api_key, "User-Agent": "GrahakChetna/1.0"}
+        cached = _IMAGE_CACHE.get(keywords)
+        if cached and os.path.exists(cached):
+            logger.info(f"Reusing Pexels image {cached}")
+            return cached
+
+        session = _get_pexels_session()
+        headers = {"Authorization": pexels_api_key}
         params = {"query": keywords, "per_page": 1, "page": 1}
-        resp = requests.get(
-            "https://api.pexels.com/v1/search",
+        resp = session.get(
+            PEXELS_SEARCH_URL,
             headers=headers,
             params=params,
             timeout=10,
@@ -52,9 +87,8 @@ def fetch_image_from_pexels(headline, dimension=800):
         basename = f"pexels_{ts}_{photo.get('id')}.jpg"
         outpath = os.path.join("uploads", basename)
 
-        with requests.get(
+        with session.get(
             image_url,
-            headers={"User-Agent": "GrahakChetna/1.0"},
             stream=True,
             timeout=15,
         ) as r:
@@ -67,6 +101,10 @@ def fetch_image_from_pexels(headline, dimension=800):
                         f.write(chunk)
 
         logger.info(f"Downloaded Pexels image to {outpath}")
+        with _IMAGE_CACHE_LOCK:
+            _IMAGE_CACHE[keywords] = outpath
+            if len(_IMAGE_CACHE) > _IMAGE_CACHE_MAX:
+                _IMAGE_CACHE.pop(next(iter(_IMAGE_CACHE)), None)
         return outpath
 
     except Exception as e:
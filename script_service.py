@@ -1,10 +1,29 @@
 import os
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
 load_dotenv()
 API_KEY = os.getenv("GROQ_API_KEY")
 
+GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
+
+_GROQ_SESSION = None
+
+
+def get_groq_session():
+    """Shared keep-alive session for Groq API calls.
+
+    Reusing one connection pool avoids a new TCP + TLS handshake per script.
+    """
+    global _GROQ_SESSION
+    if _GROQ_SESSION is None:
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=8))
+        session.headers.update({"Authorization": f"Bearer {API_KEY}", "Content-Type": "application/json"})
+        _GROQ_SESSION = session
+    return _GROQ_SESSION
+
 
 def generate_script(headline, description, language):
 
@@ -38,16 +57,12 @@ def generate_script(headline, description, language):
     [Headline]. [Description].
     """
 
-    url = "https://api.groq.com/openai/v1/chat/completions"
-
-    headers = {"Authorization": f"Bearer {API_KEY}", "Content-Type": "application/json"}
-
     data = {
         "model": "llama-3.3-70b-versatile",
         "messages": [{"role": "user", "content": prompt}],
     }
 
-    response = requests.post(url, headers=headers, json=data)
+    response = get_groq_session().post(GROQ_URL, json=data)
 
     if response.status_code != 200:
         print("Groq Error:", response.text)
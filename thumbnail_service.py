@@ -1,11 +1,16 @@
 from PIL import Image, ImageDraw, ImageFont
+from functools import lru_cache
 import textwrap
 
+@lru_cache(maxsize=1)
+def _headline_font():
+    return ImageFont.truetype("assets/font.ttf", 80)
+
 def create_thumbnail(headline):
     img = Image.new("RGB", (1280, 720), color=(0, 0, 0))
     draw = ImageDraw.Draw(img)
 
-    font = ImageFont.truetype("assets/font.ttf", 80)
+    font = _headline_font()
     wrapped = textwrap.fill(headline, width=20)
 
     draw.text((100, 200), wrapped, font=font, fill="white")
@@ -2,14 +2,38 @@ import re
 import asyncio
 import logging
 import os
+import random
+import atexit
+import shutil
+import uuid
 import hashlib
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple, Dict, List
 from pathlib import Path
-from threading import Lock
+from threading import Lock, Thread
 from dataclasses import dataclass
 
 import edge_tts
 
+try:
+    import uvloop  # Optional: faster event loop on Linux/macOS
+except ImportError:
+    uvloop = None
+
+# Fallback providers are imported once at load so the first fallback request
+# doesn't pay the import cost
+try:
+    from gtts import gTTS
+except ImportError:
+    gTTS = None
+
+try:
+    import pyttsx3
+except ImportError:
+    pyttsx3 = None
+
 logger = logging.getLogger(__name__)
 
 # ======================================
@@ -75,31 +99,62 @@ DEFAULT_OUTPUT_PATH = os.path.join(DEFAULT_OUTPUT_DIR, "voice.mp3")
 Path(DEFAULT_OUTPUT_DIR).mkdir(parents=True, exist_ok=True)
 Path(CACHE_DIR).mkdir(parents=True, exist_ok=True)
 
+# Synthesize multi-sentence scripts one sentence at a time so an edited script
+# only re-synthesizes the sentences that changed. Off by default since
+# prosody across sentence boundaries is slightly less natural.
+SHARD_SENTENCES = os.getenv("TTS_SHARD_SENTENCES", "false").lower() in ("true", "1", "on")
+
+# Upper bound on total cache size; least recently used entries are evicted
+CACHE_MAX_BYTES = int(os.getenv("TTS_CACHE_MAX_BYTES", str(1024 * 1024 * 1024)))
+
+# Race Edge TTS against ElevenLabs and keep whichever finishes first.
+# Off by default since it doubles provider cost per request.
+RACE_PROVIDERS = os.getenv("TTS_RACE_PROVIDERS", "false").lower() in ("true", "1", "on")
+
 SPEED_RATE = "-9%"  # Slightly faster for natural news delivery
 MIN_TEXT_LENGTH = 1  # Minimum text length (words)
 MAX_TEXT_LENGTH = 1000  # Maximum text length (characters)
 
 # ======================================
-# THREAD-SAFE LOCKING FOR EDGE TTS
+# ASYNC CONCURRENCY CONTROL
 # ======================================
 
+# All TTS coroutines run on the single background loop, so plain asyncio
+# primitives are enough. They are created lazily on that loop.
+
 # Ensure only ONE Edge TTS request at a time (prevents parallel calls)
-EDGE_TTS_LOCK = Lock()
+_EDGE_TTS_SEMAPHORE = None
 
-# For async contexts, we need an asyncio.Lock
-_ASYNC_EDGE_TTS_LOCK = None
+# Blocking gTTS calls get their own pool instead of the loop's shared default
+# executor (pyttsx3 has a dedicated thread, see below)
+_TTS_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tts-blocking")
+atexit.register(_TTS_EXECUTOR.shutdown)
 
-def _get_async_lock():
-    """Get or create asyncio.Lock for async Edge TTS calls."""
-    global _ASYNC_EDGE_TTS_LOCK
-    if _ASYNC_EDGE_TTS_LOCK is None:
-        try:
-            asyncio.get_running_loop()
-            _ASYNC_EDGE_TTS_LOCK = asyncio.Lock()
-        except RuntimeError:
-            # No running loop, will be created later
-            pass
-    return _ASYNC_EDGE_TTS_LOCK
+# Serialize requests that target the same output file. Weak values: a lock
+# disappears once no request holds or waits on it, so unique per-call paths
+# (e.g. sentence shards) don't accumulate.
+_OUTPUT_LOCKS: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+# In-flight syntheses keyed by cache key, so identical concurrent requests
+# share one upstream call. Only touched from the background loop thread.
+_INFLIGHT: Dict[str, asyncio.Future] = {}
+
+
+def _get_edge_semaphore() -> asyncio.Semaphore:
+    """Get or create the semaphore limiting concurrent Edge TTS calls."""
+    global _EDGE_TTS_SEMAPHORE
+    if _EDGE_TTS_SEMAPHORE is None:
+        _EDGE_TTS_SEMAPHORE = asyncio.Semaphore(1)
+    return _EDGE_TTS_SEMAPHORE
+
+
+def _get_output_lock(output_path: str) -> asyncio.Lock:
+    """Get or create the lock guarding writes to output_path."""
+    key = os.path.abspath(output_path)
+    lock = _OUTPUT_LOCKS.get(key)
+    if lock is None:
+        lock = _OUTPUT_LOCKS[key] = asyncio.Lock()
+    return lock
 
 
 # ======================================
@@ -128,13 +183,36 @@ def validate_voice_name(voice: str) -> bool:
         return False
 
 
+def _resolve_default_voice() -> str:
+    """
+    Pick the voice used when no valid voice is requested.
+    
+    1. PRIMARY_VOICE if valid
+    2. Otherwise the first valid fallback voice
+    3. Last resort: PRIMARY_VOICE anyway (Edge TTS may accept it)
+    """
+    if validate_voice_name(PRIMARY_VOICE):
+        return PRIMARY_VOICE
+    
+    for voice in FALLBACK_VOICES:
+        if validate_voice_name(voice):
+            return voice
+    
+    logger.warning(f"No validated voice available, using primary: {PRIMARY_VOICE}")
+    return PRIMARY_VOICE
+
+
+# Depends only on module constants, so resolve it once at import
+_DEFAULT_VOICE = _resolve_default_voice()
+
+
 def get_best_voice(requested_voice: Optional[str] = None) -> str:
     """
     Get the best available voice with smart fallback logic.
     
     1. If requested_voice is valid, use it
-    2. Otherwise, use PRIMARY_VOICE
-    3. If PRIMARY_VOICE unavailable, try fallback voices
+    2. Otherwise, use the default voice (PRIMARY_VOICE, or the first valid
+       fallback voice), resolved once at import
     
     Args:
         requested_voice: Optional voice name requested by user
@@ -142,27 +220,14 @@ def get_best_voice(requested_voice: Optional[str] = None) -> str:
     Returns:
         Best available voice name
     """
-    logger.info(f"Voice selection: requested={requested_voice}")
-    
-    # Try requested voice first
-    if requested_voice and validate_voice_name(requested_voice):
+    if isinstance(requested_voice, str) and requested_voice in VALID_VOICES:
         logger.info(f"Using requested voice: {requested_voice}")
         return requested_voice
     
-    # Try primary voice
-    if validate_voice_name(PRIMARY_VOICE):
-        logger.info(f"Using primary voice: {PRIMARY_VOICE}")
-        return PRIMARY_VOICE
-    
-    # Fallback to first available fallback voice
-    for voice in FALLBACK_VOICES:
-        if validate_voice_name(voice):
-            logger.info(f"Using fallback voice: {voice}")
-            return voice
-    
-    # Last resort - use primary anyway (Edge TTS may accept it)
-    logger.warning(f"No validated voice available, using primary: {PRIMARY_VOICE}")
-    return PRIMARY_VOICE
+    if requested_voice:
+        logger.warning(f"✗ Voice not valid: {requested_voice}")
+    logger.info(f"Using default voice: {_DEFAULT_VOICE}")
+    return _DEFAULT_VOICE
 
 
 # ======================================
@@ -170,30 +235,24 @@ def get_best_voice(requested_voice: Optional[str] = None) -> str:
 # ======================================
 
 
+# Any run of spaces/tabs/newlines collapses to a single space
+_WHITESPACE_RUN_RE = re.compile(r'[ \n\r\t]+')
+
+
 def _remove_emojis_and_non_ascii(text: str) -> str:
     """
     Remove emojis and non-ASCII characters while preserving basic punctuation.
     Keeps: letters, numbers, basic punctuation (.,!?'-"), spaces
     """
-    cleaned = []
-    for char in text:
-        # Check if character is ASCII or allowed punctuation
-        if ord(char) < 128:  # ASCII range
-            cleaned.append(char)
-        elif char in ' ':  # Keep spaces for unicode
-            cleaned.append(char)
-        # Skip emojis and non-ASCII characters
-    
-    return ''.join(cleaned)
+    # ASCII encode with errors="ignore" drops every non-ASCII code point in a
+    # single C-level pass (equivalent to filtering ord(char) < 128)
+    return text.encode('ascii', 'ignore').decode('ascii')
 
 
 def _collapse_whitespace(text: str) -> str:
     """Collapse multiple spaces, tabs, newlines into single space."""
-    # Replace newlines and tabs with spaces
-    text = re.sub(r'[\n\r\t]+', ' ', text)
-    # Collapse multiple spaces into single space
-    text = re.sub(r' {2,}', ' ', text)
-    return text.strip()
+    # Newline/tab replacement and space collapsing in a single pass
+    return _WHITESPACE_RUN_RE.sub(' ', text).strip()
 
 
 def preprocess_text(text: str, max_length: int = 1000) -> str:
@@ -241,14 +300,14 @@ def preprocess_text(text: str, max_length: int = 1000) -> str:
     # Step 5: Limit to max_length
     if len(text) > max_length:
         logger.warning(f"Text exceeds max length ({len(text)} > {max_length}), truncating")
-        # Truncate at word boundary if possible
-        text = text[:max_length]
-        # Try to cut at last space to avoid cutting mid-word
-        last_space = text.rfind(' ')
-        if last_space > max_length * 0.8:  # Only if space is reasonably close
-            text = text[:last_space]
-    
-    final_text = text.strip()
+        # Truncate at word boundary if possible: rpartition splits on the last
+        # space in a single pass, and we only take it if it is reasonably close
+        head, _, _ = text[:max_length].rpartition(' ')
+        text = head if len(head) > max_length * 0.8 else text[:max_length]
+        final_text = text.rstrip()
+    else:
+        # Already stripped and whitespace-collapsed above
+        final_text = text
     
     if not final_text:
         logger.error("Text is empty after final processing")
@@ -262,10 +321,150 @@ def preprocess_text(text: str, max_length: int = 1000) -> str:
 # CACHE SYSTEM
 # ======================================
 
-def get_cache_path(text: str) -> str:
-    """Generate cache path based on text hash."""
-    hash_id = hashlib.md5(text.encode()).hexdigest()
-    return os.path.join(CACHE_DIR, f"{hash_id}.mp3")
+def _file_size(path: str) -> int:
+    """Return file size in bytes from a single stat() call (0 if missing)."""
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return 0
+
+
+def _cache_key(text: str, voice: Optional[str] = None) -> str:
+    """
+    Hash the raw request into a cache key.
+    
+    The key covers the raw input text, requested voice and speech rate, so a
+    cache hit can be detected before any text preprocessing runs.
+    """
+    key_bytes = repr((text, voice or "", SPEED_RATE)).encode("utf-8")
+    return hashlib.blake2b(key_bytes, digest_size=16).hexdigest()
+
+
+def get_cache_path(text: str, voice: Optional[str] = None) -> str:
+    """Generate cache path based on a hash of the raw request."""
+    return f"{CACHE_DIR}/{_cache_key(text, voice)}.mp3"
+
+
+def _cache_lookup(key: str) -> Tuple[str, bool]:
+    """
+    Cache probe returning (cache_path, exists) from a single stat().
+    
+    The filesystem is the source of truth, since other worker processes
+    write to the same cache directory; entries they wrote are added to this
+    process's LRU index on first sight.
+    """
+    cache_path = f"{CACHE_DIR}/{key}.mp3"
+    size = _file_size(cache_path)
+    if not size:
+        return cache_path, False
+    if cache_path not in _CACHE_INDEX:
+        _record_cache_entry(cache_path, size)
+    return cache_path, True
+
+
+# LRU index of cache entries (cache_path -> size in bytes), oldest first.
+# Touched from the event loop and from worker threads, hence the lock.
+_CACHE_INDEX: "OrderedDict[str, int]" = OrderedDict()
+_CACHE_BYTES = 0
+_CACHE_INDEX_LOCK = Lock()
+
+
+def _load_cache_index() -> None:
+    """Populate the LRU index from CACHE_DIR, oldest modification first."""
+    global _CACHE_BYTES
+    entries = []
+    with os.scandir(CACHE_DIR) as it:
+        for entry in it:
+            if not entry.name.endswith(".mp3") or not entry.is_file():
+                continue
+            st = entry.stat()
+            entries.append((st.st_mtime, f"{CACHE_DIR}/{entry.name}", st.st_size))
+    entries.sort()
+    with _CACHE_INDEX_LOCK:
+        _CACHE_INDEX.clear()
+        for _, path, size in entries:
+            _CACHE_INDEX[path] = size
+        _CACHE_BYTES = sum(_CACHE_INDEX.values())
+    _evict_cache()
+
+
+def _touch_cache_entry(cache_path: str) -> None:
+    """Mark a cache entry as most recently used."""
+    with _CACHE_INDEX_LOCK:
+        if cache_path in _CACHE_INDEX:
+            _CACHE_INDEX.move_to_end(cache_path)
+
+
+def _record_cache_entry(cache_path: str, size: int) -> None:
+    """Add or refresh a cache entry in the index, then enforce the size cap."""
+    global _CACHE_BYTES
+    with _CACHE_INDEX_LOCK:
+        _CACHE_BYTES += size - _CACHE_INDEX.pop(cache_path, 0)
+        _CACHE_INDEX[cache_path] = size
+    _evict_cache()
+
+
+def _evict_cache() -> None:
+    """
+    Unlink least recently used entries until the cache fits CACHE_MAX_BYTES.
+    
+    The newest entry is always kept. Outputs hardlinked to an evicted entry
+    keep their data; only the cache name goes away.
+    """
+    global _CACHE_BYTES
+    evicted = []
+    with _CACHE_INDEX_LOCK:
+        while _CACHE_BYTES > CACHE_MAX_BYTES and len(_CACHE_INDEX) > 1:
+            path, size = _CACHE_INDEX.popitem(last=False)
+            _CACHE_BYTES -= size
+            evicted.append(path)
+    if not evicted:
+        return
+    for path in evicted:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+    logger.info(f"Evicted {len(evicted)} cache entries (cache now {_CACHE_BYTES} bytes)")
+
+
+def _serve_from_cache(cache_path: str, output_path: str) -> None:
+    """
+    Materialize a cache entry at output_path without consuming it.
+    
+    Hardlinks when possible (no data copied) and falls back to a copy across
+    filesystems. Any existing output is unlinked first so the cache inode is
+    never truncated by a later write to output_path.
+    """
+    if cache_path == output_path:
+        return
+    if os.path.exists(output_path):
+        os.remove(output_path)
+    try:
+        os.link(cache_path, output_path)
+    except OSError:
+        shutil.copyfile(cache_path, output_path)
+
+
+def _staging_path(cache_path: str) -> str:
+    """Unique temp path beside cache_path that providers synthesize into."""
+    return f"{cache_path}.{uuid.uuid4().hex}.part"
+
+
+def _commit_to_cache(staging_path: str, cache_path: str, output_path: str) -> None:
+    """
+    Publish a synthesized file as a cache entry and serve it to output_path.
+    
+    The audio is written to disk exactly once (into staging_path); publishing
+    is an atomic rename, and serving is a hardlink.
+    """
+    size = _file_size(staging_path)
+    os.replace(staging_path, cache_path)
+    _serve_from_cache(cache_path, output_path)
+    _record_cache_entry(cache_path, size)
+
+
+_load_cache_index()
 
 
 # ======================================
@@ -343,6 +542,30 @@ def _is_retryable_error(error: Exception) -> bool:
 # ELEVENLABS TTS (PRIMARY FALLBACK)
 # ======================================
 
+# One pooled HTTP session for ElevenLabs, bound to the background TTS loop so
+# keep-alive connections (and their TLS sessions) are reused across requests
+_ELEVEN_SESSION = None
+
+
+async def _get_eleven_session():
+    """Get or create the shared aiohttp session for ElevenLabs calls."""
+    global _ELEVEN_SESSION
+    if _ELEVEN_SESSION is None or _ELEVEN_SESSION.closed:
+        import aiohttp
+        
+        _ELEVEN_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=60, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+    return _ELEVEN_SESSION
+
+
+async def _close_eleven_session():
+    """Close the shared ElevenLabs session if it was opened."""
+    if _ELEVEN_SESSION is not None and not _ELEVEN_SESSION.closed:
+        await _ELEVEN_SESSION.close()
+
+
 async def _elevenlabs_tts(text: str, output_path: str) -> bool:
     """
     ElevenLabs API - Premium quality voice.
@@ -360,8 +583,6 @@ async def _elevenlabs_tts(text: str, output_path: str) -> bool:
             logger.info("ElevenLabs: API key not configured, skipping")
             return False
         
-        import requests
-        
         logger.info("Trying ElevenLabs TTS")
         
         voice_id = "21m00Tcm4TlvDq8ikWAM"  # Rachel
@@ -384,22 +605,28 @@ async def _elevenlabs_tts(text: str, output_path: str) -> bool:
             }
         }
         
-        response = requests.post(url, json=data, headers=headers, timeout=30)
-        
-        if response.status_code == 200:
+        session = await _get_eleven_session()
+        async with session.post(url, json=data, headers=headers) as response:
+            if response.status != 200:
+                body = await response.text()
+                logger.warning(f"ElevenLabs failed (HTTP {response.status}): {body}")
+                return False
+            
+            # Stream audio to disk without buffering the whole response
             with open(output_path, "wb") as f:
-                f.write(response.content)
-            logger.info("✓ ElevenLabs TTS succeeded")
-            return True
-        else:
-            logger.warning(f"ElevenLabs failed (HTTP {response.status_code}): {response.text}")
-            return False
+                async for chunk in response.content.iter_chunked(65536):
+                    f.write(chunk)
+        
+        logger.info("✓ ElevenLabs TTS succeeded")
+        return True
             
     except ImportError:
-        logger.warning("requests library not available for ElevenLabs")
+        logger.warning("aiohttp library not available for ElevenLabs")
         return False
     except Exception as e:
         logger.warning(f"ElevenLabs error: {type(e).__name__}: {e}")
+        if os.path.exists(output_path):
+            os.remove(output_path)
         return False
 
 
@@ -410,24 +637,24 @@ async def _elevenlabs_tts(text: str, output_path: str) -> bool:
 async def _edge_tts_with_smart_retry(
     text: str,
     output_path: str,
-    voice: Optional[str] = None,
+    voice: str,
     max_attempts: int = 3
 ) -> bool:
     """
-    Edge TTS with intelligent retry logic, voice validation, and detailed diagnostics:
+    Edge TTS with intelligent retry logic and detailed diagnostics:
     
     Features:
-    - Voice validation before attempting synthesis
-    - Automatic fallback to alternative voices if primary fails
+    - Expects a voice already resolved by the caller (get_best_voice): one of
+      VALID_VOICES or _DEFAULT_VOICE; no alternative voices are tried here
     - Retries ONLY on transient errors (403, 503, timeouts)
     - Does NOT retry on non-transient errors (NoAudioReceived, invalid voice)
-    - Exponential backoff with jitter for retryable errors
+    - Decorrelated-jitter backoff for retryable errors
     - WebSocket error handling
     - Event loop safety for Flask/async contexts
     - Detailed logging for debugging
     
     Possible causes of NoAudioReceived and how we prevent them:
-    1. Invalid voice - FIXED: Voice validation before use
+    1. Invalid voice - FIXED: get_best_voice only returns VALID_VOICES/_DEFAULT_VOICE
     2. WebSocket issue - HANDLED: Connection retries with backoff
     3. Event loop misuse - FIXED: Proper async/sync bridge
     4. Text length issue - FIXED: Text preprocessing with validation
@@ -435,32 +662,31 @@ async def _edge_tts_with_smart_retry(
     Args:
         text: Preprocessed text to synthesize
         output_path: Path to save MP3 file
-        voice: Optional voice name (uses best_voice if not specified)
+        voice: Voice name already resolved by get_best_voice()
         max_attempts: Maximum retry attempts (default 3)
     
     Returns:
         True if successful, False otherwise (caller should try fallback)
     """
     
-    # Get validated voice with fallback
-    selected_voice = get_best_voice(voice)
+    # Caller has already validated the voice via get_best_voice()
+    assert voice in VALID_VOICES or voice == _DEFAULT_VOICE, f"Unvalidated voice: {voice}"
+    selected_voice = voice
     logger.info(f"Edge TTS initialized with voice: {selected_voice}, text_len={len(text)} chars")
     
-    # Acquire async lock to prevent parallel Edge TTS requests
-    async_lock = None
-    try:
-        asyncio.get_running_loop()
-        async_lock = asyncio.Lock()
-        logger.debug("Event loop found, using async lock")
-    except RuntimeError:
-        logger.debug("No running event loop, will create one")
+    # Shared semaphore prevents parallel Edge TTS requests without blocking
+    # other providers running on the same loop
+    edge_semaphore = _get_edge_semaphore()
     
     async def _do_edge_tts(attempt_num: int):
         """Inner function for actual Edge TTS call."""
         try:
             logger.info(f"  [Attempt {attempt_num}] Calling Edge TTS (voice={selected_voice}, text_len={len(text)})")
             
-            # Create Communicate object with realistic User-Agent
+            # Create Communicate object with realistic User-Agent.
+            # Each save() opens its own WebSocket: edge-tts 6.1.3 builds the
+            # session inside stream() and has no hook for reusing it, so a
+            # connection pool would mean reimplementing its protocol.
             communicate = edge_tts.Communicate(
                 text=text,
                 voice=selected_voice,
@@ -479,19 +705,20 @@ async def _edge_tts_with_smart_retry(
                     os.remove(output_path)
                 raise Exception("Edge TTS timeout - WebSocket may be stuck")
             
-            # Verify file was created and has content
-            if os.path.exists(output_path):
-                file_size = os.path.getsize(output_path)
-                if file_size > 1000:  # Reasonable minimum size for audio
-                    logger.info(f"  ✓ [Attempt {attempt_num}] Audio file created successfully ({file_size} bytes)")
-                    return True
-                else:
-                    logger.warning(f"  ✗ [Attempt {attempt_num}] Output file too small ({file_size} bytes), likely invalid")
-                    os.remove(output_path)
-                    raise Exception(f"Invalid output file size: {file_size} bytes")
-            else:
+            # Verify file was created and has content (one stat call)
+            try:
+                file_size = os.stat(output_path).st_size
+            except FileNotFoundError:
                 logger.warning(f"  ✗ [Attempt {attempt_num}] Output file not created")
                 raise Exception("Output file was not created")
+            
+            if file_size > 1000:  # Reasonable minimum size for audio
+                logger.info(f"  ✓ [Attempt {attempt_num}] Audio file created successfully ({file_size} bytes)")
+                return True
+            else:
+                logger.warning(f"  ✗ [Attempt {attempt_num}] Output file too small ({file_size} bytes), likely invalid")
+                os.remove(output_path)
+                raise Exception(f"Invalid output file size: {file_size} bytes")
                 
         except Exception:
             if os.path.exists(output_path):
@@ -501,18 +728,15 @@ async def _edge_tts_with_smart_retry(
                     pass
             raise
     
-    # Retry loop with exponential backoff
+    # Retry loop with decorrelated-jitter backoff
     attempt_errors = []
+    backoff_seconds = 1.0
     
     for attempt in range(1, max_attempts + 1):
         try:
             logger.debug(f"Starting attempt {attempt}/{max_attempts}...")
             
-            # If we have an async lock, use it to prevent parallel calls
-            if async_lock:
-                async with async_lock:
-                    success = await _do_edge_tts(attempt)
-            else:
+            async with edge_semaphore:
                 success = await _do_edge_tts(attempt)
             
             if success:
@@ -541,14 +765,12 @@ async def _edge_tts_with_smart_retry(
             
             # Retryable error - apply exponential backoff if more attempts remain
             if attempt < max_attempts:
-                # Calculate backoff: 2^attempt seconds, max 32 seconds
-                backoff_seconds = min(2 ** attempt, 32)
-                # Add small jitter to prevent thundering herd
-                jitter = 0.1 * (attempt % 2)
-                backoff_with_jitter = backoff_seconds + jitter
+                # Decorrelated jitter: each wait is drawn between 0.5s and 3x
+                # the previous wait (max 30s), so concurrent retries spread out
+                backoff_seconds = min(30.0, random.uniform(0.5, backoff_seconds * 3))
                 
-                logger.info(f"  → Retryable error detected, backing off {backoff_with_jitter:.1f}s before attempt {attempt + 1}...")
-                await asyncio.sleep(backoff_with_jitter)
+                logger.info(f"  → Retryable error detected, backing off {backoff_seconds:.1f}s before attempt {attempt + 1}...")
+                await asyncio.sleep(backoff_seconds)
             else:
                 logger.warning(f"  ✗ Maximum attempts ({max_attempts}) reached - proceeding to fallback")
     
@@ -558,6 +780,222 @@ async def _edge_tts_with_smart_retry(
     return False
 
 
+# ======================================
+# PROVIDER RACE (EDGE VS ELEVENLABS)
+# ======================================
+
+async def _race_edge_and_elevenlabs(
+    text: str,
+    voice: str,
+    cache_path: str,
+) -> Tuple[Optional[str], Optional[str], Dict]:
+    """
+    Run Edge TTS and ElevenLabs concurrently and keep the first success.
+    
+    The losing task is cancelled and its staging file removed. Latency becomes
+    min(t_edge, t_elevenlabs) instead of t_edge + t_elevenlabs on Edge failure.
+    
+    Args:
+        text: Preprocessed text to synthesize
+        voice: Validated Edge voice name
+        cache_path: Cache entry the winner will be published to
+    
+    Returns:
+        Tuple of (winner_name, winner_staging_path, error_details);
+        winner fields are None if both providers failed
+    """
+    paths = {
+        "Edge TTS": _staging_path(cache_path),
+        "ElevenLabs": _staging_path(cache_path),
+    }
+    tasks = {
+        asyncio.create_task(
+            _edge_tts_with_smart_retry(text, paths["Edge TTS"], voice=voice, max_attempts=3)
+        ): "Edge TTS",
+        asyncio.create_task(_elevenlabs_tts(text, paths["ElevenLabs"])): "ElevenLabs",
+    }
+    
+    winner = None
+    error_details = {}
+    pending = set(tasks)
+    try:
+        while pending and winner is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = tasks[task]
+                if task.exception() is not None:
+                    error = task.exception()
+                    logger.warning(f"{name} race error: {type(error).__name__}: {error}")
+                    error_key = "edge_tts" if name == "Edge TTS" else "elevenlabs_tts"
+                    error_details[error_key] = {"error": str(error), "type": type(error).__name__}
+                elif task.result() and _file_size(paths[name]) > 1000 and winner is None:
+                    winner = name
+                else:
+                    logger.warning(f"{name} did not produce audio in race")
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        for name, path in paths.items():
+            if name != winner and os.path.exists(path):
+                os.remove(path)
+    
+    if winner:
+        return winner, paths[winner], error_details
+    return None, None, error_details
+
+
+# ======================================
+# SENTENCE SHARDING
+# ======================================
+
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+def _split_sentences(text: str) -> List[str]:
+    """Split preprocessed text on sentence boundaries."""
+    return [sentence for sentence in _SENTENCE_SPLIT_RE.split(text) if sentence]
+
+
+def _is_mp3(path: str) -> bool:
+    """Check for an ID3 tag or an MPEG frame sync at the start of the file."""
+    with open(path, "rb") as f:
+        head = f.read(3)
+    return head == b"ID3" or (len(head) >= 2 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0)
+
+
+# Layer III bitrates (kbps) and sample rates, indexed from the frame header
+# (version bits: 3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5)
+_MP3_BITRATES_V1 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+_MP3_BITRATES_V2 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+
+def _mp3_frame_length(header: bytes) -> int:
+    """Length of the Layer III frame starting with header (0 if unparseable)."""
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return 0
+    version = (header[1] >> 3) & 0x03
+    layer = (header[1] >> 1) & 0x03
+    bitrate_index = header[2] >> 4
+    rate_index = (header[2] >> 2) & 0x03
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+        return 0
+    bitrate = (_MP3_BITRATES_V1 if version == 3 else _MP3_BITRATES_V2)[bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+    padding = (header[2] >> 1) & 0x01
+    return (144 if version == 3 else 72) * bitrate // sample_rate + padding
+
+
+def _mp3_audio_frames(data: bytes) -> bytes:
+    """
+    Strip the ID3v2/ID3v1 tags and the Xing/Info/VBRI header frame.
+    
+    Those describe a single file; left in the middle of a joined stream they
+    make players and MoviePy misreport the duration.
+    """
+    if data[:3] == b"ID3" and len(data) >= 10:
+        tag_size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        footer = 10 if data[5] & 0x10 else 0
+        data = data[10 + tag_size + footer:]
+    if len(data) >= 128 and data[-128:-125] == b"TAG":
+        data = data[:-128]
+    frame_length = _mp3_frame_length(data[:4])
+    if frame_length:
+        first_frame = data[:frame_length]
+        if b"Xing" in first_frame or b"Info" in first_frame or b"VBRI" in first_frame:
+            data = data[frame_length:]
+    return data
+
+
+def _shard_cache_path(sentence: str, voice: str, provider: str) -> str:
+    """Cache path for one sentence as rendered by one provider."""
+    key_bytes = repr((sentence, voice, SPEED_RATE, provider)).encode("utf-8")
+    return f"{CACHE_DIR}/{hashlib.blake2b(key_bytes, digest_size=16).hexdigest()}.mp3"
+
+
+async def _synthesize_shard(synthesize, sentence: str, cache_path: str) -> bool:
+    """Render one sentence with one provider and publish it at cache_path."""
+    staging_path = _staging_path(cache_path)
+    try:
+        if not await synthesize(sentence, staging_path):
+            return False
+        size = _file_size(staging_path)
+        if not size or not _is_mp3(staging_path):
+            return False
+        os.replace(staging_path, cache_path)
+        _record_cache_entry(cache_path, size)
+        return True
+    finally:
+        if os.path.exists(staging_path):
+            os.remove(staging_path)
+
+
+async def _synthesize_sharded(
+    sentences: List[str],
+    voice: str,
+    staging_path: str,
+) -> bool:
+    """
+    Synthesize each sentence separately and concatenate them into staging_path.
+    
+    Sentences are cached per (sentence, voice, provider). The first sentence
+    walks the provider chain (Edge, ElevenLabs, gTTS) and pins the provider
+    that serves it; every other sentence must come from that same provider,
+    so one narration never mixes voices or sample rates. Missing sentences
+    are requested together, but Edge calls still pass through the Edge
+    semaphore one at a time: the gain is per-sentence cache reuse, not
+    parallel synthesis. Tags and Xing headers are stripped from each part
+    before the frames are joined, so no re-encode is needed.
+    
+    Returns:
+        True if staging_path holds the joined audio, False if the pinned
+        provider failed on any sentence
+    """
+    providers = [("Edge TTS", lambda text, path: _edge_tts_with_smart_retry(text, path, voice=voice, max_attempts=3))]
+    if ELEVEN_API_KEY:
+        providers.append(("ElevenLabs", _elevenlabs_tts))
+    providers.append(("gTTS", lambda text, path: _gtts_tts(text, path, language="en")))
+    
+    try:
+        pinned = None
+        for name, synthesize in providers:
+            first_path = _shard_cache_path(sentences[0], voice, name)
+            if os.path.exists(first_path) or await _synthesize_shard(synthesize, sentences[0], first_path):
+                pinned = name, synthesize
+                break
+        if pinned is None:
+            return False
+        
+        name, synthesize = pinned
+        logger.info(f"Sentence shards pinned to {name}")
+        part_paths = [_shard_cache_path(sentence, voice, name) for sentence in sentences]
+        missing = dict.fromkeys(
+            (sentence, path) for sentence, path in zip(sentences, part_paths)
+            if not os.path.exists(path)
+        )
+        results = await asyncio.gather(*(
+            _synthesize_shard(synthesize, sentence, path) for sentence, path in missing
+        ))
+        if not all(results):
+            logger.warning(f"{name} failed on {results.count(False)} sentence(s), dropping shards")
+            return False
+        
+        with open(staging_path, "wb") as out:
+            for part_path in part_paths:
+                with open(part_path, "rb") as part:
+                    out.write(_mp3_audio_frames(part.read()))
+                _touch_cache_entry(part_path)
+        return True
+        
+    except Exception as e:
+        logger.warning(f"Sentence sharding failed: {type(e).__name__}: {str(e)[:100]}")
+        if os.path.exists(staging_path):
+            os.remove(staging_path)
+        return False
+
+
 # ======================================
 # GTTS FALLBACK
 # ======================================
@@ -574,9 +1012,11 @@ async def _gtts_tts(text: str, output_path: str, language: str = "en") -> bool:
     Returns:
         True if successful, False otherwise
     """
+    if gTTS is None:
+        logger.warning("gtts library not installed")
+        return False
+    
     try:
-        from gtts import gTTS
-        
         logger.info(f"Trying gTTS with language={language}")
         
         def _save():
@@ -584,10 +1024,11 @@ async def _gtts_tts(text: str, output_path: str, language: str = "en") -> bool:
             tts.save(output_path)
         
         # Run gTTS in thread pool to avoid blocking
-        await asyncio.to_thread(_save)
+        await asyncio.get_running_loop().run_in_executor(_TTS_EXECUTOR, _save)
         
-        if os.path.exists(output_path) and os.path.getsize(output_path) > 1000:
-            logger.info(f"✓ gTTS succeeded ({os.path.getsize(output_path)} bytes)")
+        file_size = _file_size(output_path)
+        if file_size > 1000:
+            logger.info(f"✓ gTTS succeeded ({file_size} bytes)")
             return True
         else:
             logger.warning("gTTS created invalid or empty file")
@@ -595,9 +1036,6 @@ async def _gtts_tts(text: str, output_path: str, language: str = "en") -> bool:
                 os.remove(output_path)
             return False
             
-    except ImportError:
-        logger.warning("gtts library not installed")
-        return False
     except Exception as e:
         logger.warning(f"gTTS failed: {type(e).__name__}: {e}")
         if os.path.exists(output_path):
@@ -609,6 +1047,24 @@ async def _gtts_tts(text: str, output_path: str, language: str = "en") -> bool:
 # PYTTSX3 OFFLINE FALLBACK
 # ======================================
 
+# pyttsx3 engine is built once (driver load is slow) and reused. Drivers
+# (sapi5 COM, nsss run loop, espeak) are bound to the thread that created
+# them, so the engine lives on one dedicated thread and is only ever driven
+# from it; the single worker also serializes calls.
+_PYTTSX3_ENGINE = None
+_PYTTSX3_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts-pyttsx3")
+atexit.register(_PYTTSX3_EXECUTOR.shutdown)
+
+
+def _get_pyttsx3_engine():
+    """Get or create the shared pyttsx3 engine. Only call on _PYTTSX3_EXECUTOR."""
+    global _PYTTSX3_ENGINE
+    if _PYTTSX3_ENGINE is None:
+        _PYTTSX3_ENGINE = pyttsx3.init()
+        _PYTTSX3_ENGINE.setProperty("rate", 175)  # Slightly faster speed
+    return _PYTTSX3_ENGINE
+
+
 async def _pyttsx3_tts(text: str, output_path: str) -> bool:
     """
     pyttsx3 offline TTS - last resort fallback.
@@ -621,29 +1077,28 @@ async def _pyttsx3_tts(text: str, output_path: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    if pyttsx3 is None:
+        logger.warning("pyttsx3 library not installed")
+        return False
+    
     try:
-        import pyttsx3
-        
         logger.info("Trying pyttsx3 offline TTS")
         
         def _save():
-            engine = pyttsx3.init()
-            engine.setProperty("rate", 175)  # Slightly faster speed
+            engine = _get_pyttsx3_engine()
             engine.save_to_file(text, output_path)
             engine.runAndWait()
         
-        await asyncio.to_thread(_save)
+        await asyncio.get_running_loop().run_in_executor(_PYTTSX3_EXECUTOR, _save)
         
-        if os.path.exists(output_path):
-            logger.info(f"✓ pyttsx3 succeeded ({os.path.getsize(output_path)} bytes)")
+        file_size = _file_size(output_path)
+        if file_size:
+            logger.info(f"✓ pyttsx3 succeeded ({file_size} bytes)")
             return True
         else:
             logger.warning("pyttsx3 did not create output file")
             return False
             
-    except ImportError:
-        logger.warning("pyttsx3 library not installed")
-        return False
     except Exception as e:
         logger.warning(f"pyttsx3 failed: {type(e).__name__}: {e}")
         if os.path.exists(output_path):
@@ -656,7 +1111,7 @@ async def _pyttsx3_tts(text: str, output_path: str) -> bool:
 # MAIN ASYNC FUNCTION - FALLBACK ORDER
 # ======================================
 
-async def generate_voice_async(
+async def _generate_voice_on_loop(
     text: str,
     output_path: Optional[str] = None,
     voice: Optional[str] = None,
@@ -664,6 +1119,9 @@ async def generate_voice_async(
     """
     Generate voice audio with comprehensive fallback strategy and error handling.
     
+    Must run on _LOOP: the Edge semaphore, in-flight futures and output locks
+    are bound to it. Callers go through generate_voice / generate_voice_async.
+    
     Fallback order:
     1. Edge TTS (max 3 attempts, smart retry logic, voice validation)
     2. Azure TTS (1 attempt, if configured)
@@ -684,6 +1142,66 @@ async def generate_voice_async(
     if output_path is None:
         output_path = DEFAULT_OUTPUT_PATH
     
+    key = _cache_key(text, voice)
+    inflight = _INFLIGHT.get(key)
+    
+    if inflight is not None:
+        # An identical request is already synthesizing: wait for it instead
+        # of hitting the providers again
+        logger.info("Identical TTS request in flight, waiting for its result")
+        try:
+            leader_path, error = await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            if not inflight.cancelled():
+                raise
+            # The leading request was cancelled; synthesize on our own
+            leader_path, error = None, None
+        if error is not None:
+            # Likely transient: retry on our own rather than share the failure
+            logger.info("Identical TTS request failed, synthesizing independently")
+            leader_path = None
+        async with _get_output_lock(output_path):
+            if leader_path and not _cache_lookup(key)[1]:
+                # Uncached result (pyttsx3): copy the leader's file rather
+                # than synthesizing again. A copy, not a hardlink, since the
+                # leader's path may be rewritten in place later.
+                if leader_path == output_path:
+                    return output_path, None
+                try:
+                    shutil.copyfile(leader_path, output_path)
+                    return output_path, None
+                except OSError as e:
+                    logger.warning(f"Could not copy leader's audio, re-synthesizing: {e}")
+            # On success the audio is normally cached, so this is a cache hit
+            return await _synthesize_voice(text, output_path, voice, key)
+    
+    inflight = asyncio.get_running_loop().create_future()
+    _INFLIGHT[key] = inflight
+    try:
+        # Requests for different outputs run concurrently; same-path requests
+        # are serialized so they never clobber each other's file
+        async with _get_output_lock(output_path):
+            result = await _synthesize_voice(text, output_path, voice, key)
+        inflight.set_result(result)
+        return result
+    finally:
+        _INFLIGHT.pop(key, None)
+        if not inflight.done():
+            inflight.cancel()
+
+
+async def _synthesize_voice(
+    text: str,
+    output_path: str,
+    voice: Optional[str],
+    key: str,
+) -> Tuple[Optional[str], Optional[TTSError]]:
+    """
+    Body of _generate_voice_on_loop; caller holds the output_path lock.
+    
+    key is the request's _cache_key, computed once by the caller.
+    """
+    
     # Create output directory if needed
     os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
     
@@ -693,7 +1211,7 @@ async def generate_voice_async(
     error_details = {}
     
     # =========================================
-    # STEP 1: Validate and preprocess input text
+    # STEP 1: Validate input and check cache
     # =========================================
     logger.info("=" * 60)
     logger.info(f"TTS REQUEST: Input text length: {len(text) if text else 0} characters")
@@ -708,6 +1226,21 @@ async def generate_voice_async(
             error_type="INPUT_VALIDATION_ERROR"
         )
     
+    # Cache is keyed on the raw text, so a hit skips preprocessing entirely
+    cache_path, cached = _cache_lookup(key)
+    
+    if cached:
+        try:
+            _serve_from_cache(cache_path, output_path)
+            _touch_cache_entry(cache_path)
+            logger.info(f"✓ Using cached audio: {cache_path}")
+            return output_path, None
+        except FileNotFoundError:
+            logger.warning(f"Cache entry disappeared, regenerating: {cache_path}")
+    
+    # =========================================
+    # STEP 2: Preprocess input text (cache miss only)
+    # =========================================
     processed_text = preprocess_text(text, max_length=MAX_TEXT_LENGTH)
     
     if not processed_text:
@@ -723,77 +1256,97 @@ async def generate_voice_async(
     logger.info(f"Processed text length: {len(processed_text)} characters")
     logger.debug(f"Processed text preview: {processed_text[:100]}...")
     
-    # =========================================
-    # STEP 2: Check cache
-    # =========================================
-    cache_path = get_cache_path(processed_text)
-    
-    if os.path.exists(cache_path):
-        logger.info(f"✓ Using cached audio: {cache_path}")
-        # Copy cache to output path if different
-        if cache_path != output_path:
-            os.replace(cache_path, output_path)
-        return output_path, None
-    
     # Get validated voice
     selected_voice = get_best_voice(voice)
     attempted_voices.append(selected_voice)
     
-    # =========================================
-    # STEP 3: Try Edge TTS (3 attempts max for resilience)
-    # =========================================
-    logger.info("=" * 60)
-    logger.info(f"Provider 1: Edge TTS (voice: {selected_voice})")
-    logger.info("=" * 60)
-    attempted_providers.append("Edge TTS")
+    # Unlink any previous output: it may be a hardlink to a cache entry, which
+    # must never be truncated in place
+    if os.path.exists(output_path):
+        os.remove(output_path)
     
-    try:
-        success = await _edge_tts_with_smart_retry(
-            processed_text, 
-            output_path, 
-            voice=selected_voice,
-            max_attempts=3
+    # Cacheable providers write straight into a staging file in the cache
+    # directory; on success it is renamed into place and linked to output
+    staging_path = _staging_path(cache_path)
+    
+    if SHARD_SENTENCES:
+        sentences = _split_sentences(processed_text)
+        if len(sentences) > 1:
+            logger.info(f"Synthesizing {len(sentences)} sentences separately")
+            if await _synthesize_sharded(sentences, selected_voice, staging_path):
+                _commit_to_cache(staging_path, cache_path, output_path)
+                logger.info(f"✓✓✓ SUCCESS: Sentence sharding ({len(sentences)} sentences) ✓✓✓")
+                return output_path, None
+            logger.warning("Sentence sharding failed, synthesizing full text")
+    
+    if RACE_PROVIDERS and ELEVEN_API_KEY:
+        # =========================================
+        # STEP 3-4: Race Edge TTS against ElevenLabs
+        # =========================================
+        logger.info("=" * 60)
+        logger.info(f"Providers 1+2: racing Edge TTS (voice: {selected_voice}) and ElevenLabs")
+        logger.info("=" * 60)
+        attempted_providers.extend(["Edge TTS", "ElevenLabs"])
+        
+        winner, winner_path, race_errors = await _race_edge_and_elevenlabs(
+            processed_text, selected_voice, cache_path
         )
+        error_details.update(race_errors)
         
-        if success and os.path.exists(output_path) and os.path.getsize(output_path) > 1000:
-            logger.info("✓✓✓ SUCCESS: Edge TTS ✓✓✓")
-            # Cache the result
-            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
-            os.replace(output_path, cache_path)
-            os.replace(cache_path, output_path)
+        if winner:
+            logger.info(f"✓✓✓ SUCCESS: {winner} (won race) ✓✓✓")
+            _commit_to_cache(winner_path, cache_path, output_path)
             return output_path, None
-    except Exception as e:
-        logger.warning(f"Edge TTS wrapper error: {type(e).__name__}: {e}")
-        error_details["edge_tts"] = {"error": str(e), "type": type(e).__name__}
+    else:
+        # =========================================
+        # STEP 3: Try Edge TTS (3 attempts max for resilience)
+        # =========================================
+        logger.info("=" * 60)
+        logger.info(f"Provider 1: Edge TTS (voice: {selected_voice})")
+        logger.info("=" * 60)
+        attempted_providers.append("Edge TTS")
     
-    if os.path.exists(output_path):
-        os.remove(output_path)
+        try:
+            success = await _edge_tts_with_smart_retry(
+                processed_text, 
+                staging_path, 
+                voice=selected_voice,
+                max_attempts=3
+            )
+        
+            if success and _file_size(staging_path) > 1000:
+                logger.info("✓✓✓ SUCCESS: Edge TTS ✓✓✓")
+                _commit_to_cache(staging_path, cache_path, output_path)
+                return output_path, None
+        except Exception as e:
+            logger.warning(f"Edge TTS wrapper error: {type(e).__name__}: {e}")
+            error_details["edge_tts"] = {"error": str(e), "type": type(e).__name__}
     
-    # =========================================
-    # STEP 4: Try ElevenLabs TTS (if configured)
-    # ElevenLabs is preferred over Azure when API key is present.
-    # =========================================
-    logger.info("=" * 60)
-    logger.info(f"Provider 2: ElevenLabs TTS (voice: {selected_voice})")
-    logger.info("=" * 60)
-    attempted_providers.append("ElevenLabs")
+        if os.path.exists(staging_path):
+            os.remove(staging_path)
+    
+        # =========================================
+        # STEP 4: Try ElevenLabs TTS (if configured)
+        # ElevenLabs is preferred over Azure when API key is present.
+        # =========================================
+        logger.info("=" * 60)
+        logger.info(f"Provider 2: ElevenLabs TTS (voice: {selected_voice})")
+        logger.info("=" * 60)
+        attempted_providers.append("ElevenLabs")
 
-    try:
-        success = await _elevenlabs_tts(processed_text, output_path)
-
-        if success and os.path.exists(output_path) and os.path.getsize(output_path) > 1000:
-            logger.info("✓✓✓ SUCCESS: ElevenLabs TTS ✓✓✓")
-            # Cache the result
-            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
-            os.replace(output_path, cache_path)
-            os.replace(cache_path, output_path)
-            return output_path, None
-    except Exception as e:
-        logger.warning(f"ElevenLabs TTS error: {type(e).__name__}: {e}")
-        error_details["elevenlabs_tts"] = {"error": str(e), "type": type(e).__name__}
+        try:
+            success = await _elevenlabs_tts(processed_text, staging_path)
 
-    if os.path.exists(output_path):
-        os.remove(output_path)
+            if success and _file_size(staging_path) > 1000:
+                logger.info("✓✓✓ SUCCESS: ElevenLabs TTS ✓✓✓")
+                _commit_to_cache(staging_path, cache_path, output_path)
+                return output_path, None
+        except Exception as e:
+            logger.warning(f"ElevenLabs TTS error: {type(e).__name__}: {e}")
+            error_details["elevenlabs_tts"] = {"error": str(e), "type": type(e).__name__}
+
+        if os.path.exists(staging_path):
+            os.remove(staging_path)
     
     # =========================================
     # STEP 5: Try gTTS (free fallback)
@@ -803,18 +1356,15 @@ async def generate_voice_async(
     logger.info("=" * 60)
     attempted_providers.append("gTTS")
     
-    success = await _gtts_tts(processed_text, output_path, language="en")
+    success = await _gtts_tts(processed_text, staging_path, language="en")
     
-    if success and os.path.exists(output_path) and os.path.getsize(output_path) > 1000:
+    if success and _file_size(staging_path) > 1000:
         logger.info("✓✓✓ SUCCESS: gTTS ✓✓✓")
-        # Cache the result
-        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
-        os.replace(output_path, cache_path)
-        os.replace(cache_path, output_path)
+        _commit_to_cache(staging_path, cache_path, output_path)
         return output_path, None
     
-    if os.path.exists(output_path):
-        os.remove(output_path)
+    if os.path.exists(staging_path):
+        os.remove(staging_path)
     
     # =========================================
     # STEP 6: Try pyttsx3 offline (last resort)
@@ -859,30 +1409,54 @@ async def generate_voice_async(
 # SYNCHRONOUS WRAPPER (FLASK COMPATIBILITY)
 # ======================================
 
-def _get_or_create_event_loop():
+# Seconds a sync caller waits for a TTS result before giving up
+GENERATE_TIMEOUT = 300
+
+
+def _start_background_loop() -> asyncio.AbstractEventLoop:
     """
-    Safely get or create event loop for Flask/threading context.
-    Handles edge cases where event loops exist but are closed.
+    Start the event loop that runs all TTS coroutines.
+    
+    One loop lives for the whole process on a daemon thread, so sync callers
+    (Flask request threads) never create or tear down loops, and loop-bound
+    resources persist across requests. Uses uvloop when installed.
     """
+    loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+    Thread(target=loop.run_forever, name="tts-event-loop", daemon=True).start()
+    return loop
+
+
+_LOOP = _start_background_loop()
+
+
+def _shutdown_background_loop() -> None:
+    """Release loop-bound resources (pooled HTTP sessions) at exit."""
     try:
-        # Check if we're already in an async context
-        loop = asyncio.get_running_loop()
-        return loop
-    except RuntimeError:
-        pass
+        asyncio.run_coroutine_threadsafe(_close_eleven_session(), _LOOP).result(timeout=5)
+    except Exception as e:
+        logger.debug(f"TTS loop shutdown: {type(e).__name__}: {e}")
+
+
+atexit.register(_shutdown_background_loop)
+
+
+async def generate_voice_async(
+    text: str,
+    output_path: Optional[str] = None,
+    voice: Optional[str] = None,
+) -> Tuple[Optional[str], Optional[TTSError]]:
+    """
+    Async entry point, safe to await from any event loop.
     
-    try:
-        # Try to get existing event loop
-        loop = asyncio.get_event_loop()
-        if not loop.is_closed():
-            return loop
-    except RuntimeError:
-        pass
-    
-    # Create new event loop
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    return loop
+    The work is handed to the background TTS loop and awaited from the
+    caller's loop; cancelling the caller cancels the synthesis.
+    
+    Returns:
+        Tuple of (audio_path, error_or_none)
+    """
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(
+        _generate_voice_on_loop(text, output_path, voice=voice), _LOOP
+    ))
 
 
 def generate_voice(
@@ -892,15 +1466,16 @@ def generate_voice(
     **kwargs
 ) -> Dict:
     """
-    Synchronous wrapper for generate_voice_async.
+    Synchronous entry point; runs the synthesis on the background TTS loop.
     Thread-safe and Flask-compatible with proper event loop handling.
     
     Returns structured response (success or error with details) for better Flask integration.
     
     Features:
     - Voice validation and fallback
-    - Proper async/sync event loop management
-    - Thread-safe with locking (only one Edge TTS request at a time)
+    - Runs on a single shared background event loop (no per-call loop setup)
+    - Thread-safe: Edge TTS calls are limited to one at a time on the loop,
+      and requests sharing an output_path are serialized
     - Detailed error reporting
     
     Args:
@@ -933,57 +1508,54 @@ def generate_voice(
         ignored_params = [f"{k}={v}" for k, v in kwargs.items()]
         logger.info(f"Ignoring backward-compat parameters: {', '.join(ignored_params)}")
     
-    # Acquire thread-safe lock
-    with EDGE_TTS_LOCK:
-        logger.info("Acquired EDGE_TTS_LOCK - starting TTS generation")
-        logger.info(f"  voice={voice}, output_path={output_path}")
-        
+    logger.info(f"Starting TTS generation: voice={voice}, output_path={output_path}")
+    
+    try:
+        # Run on the shared background loop and wait for the result
+        future = asyncio.run_coroutine_threadsafe(
+            _generate_voice_on_loop(text, output_path, voice=voice), _LOOP
+        )
         try:
-            loop = _get_or_create_event_loop()
-            
-            # Run async function and get results
-            audio_path, tts_error = loop.run_until_complete(
-                generate_voice_async(text, output_path, voice=voice)
-            )
-            
-            if audio_path:
-                # Success
-                logger.info(f"✓ TTS generation successful: {audio_path}")
-                return {
-                    "success": True,
-                    "path": audio_path,
-                    "error": None,
-                    "error_type": None,
-                    "details": {},
-                    "attempted_providers": [],
-                    "attempted_voices": []
-                }
-            else:
-                # Failure with error object
-                error_dict = tts_error.to_dict() if tts_error else {
-                    "success": False,
-                    "error": "Unknown TTS error",
-                    "error_type": "UNKNOWN_ERROR",
-                    "details": {}
-                }
-                logger.error(f"✗ TTS generation failed: {error_dict['error']}")
-                return error_dict
-            
-        except Exception as e:
-            error_msg = f"TTS generation crashed: {type(e).__name__}: {e}"
-            logger.error(error_msg, exc_info=True)
+            audio_path, tts_error = future.result(timeout=GENERATE_TIMEOUT)
+        except BaseException:
+            future.cancel()
+            raise
+        
+        if audio_path:
+            # Success
+            logger.info(f"✓ TTS generation successful: {audio_path}")
             return {
-                "success": False,
-                "path": None,
-                "error": error_msg,
-                "error_type": "SYSTEM_ERROR",
-                "details": {"exception": type(e).__name__, "message": str(e)},
+                "success": True,
+                "path": audio_path,
+                "error": None,
+                "error_type": None,
+                "details": {},
                 "attempted_providers": [],
                 "attempted_voices": []
             }
+        else:
+            # Failure with error object
+            error_dict = tts_error.to_dict() if tts_error else {
+                "success": False,
+                "error": "Unknown TTS error",
+                "error_type": "UNKNOWN_ERROR",
+                "details": {}
+            }
+            logger.error(f"✗ TTS generation failed: {error_dict['error']}")
+            return error_dict
         
-        finally:
-            logger.info("Released EDGE_TTS_LOCK")
+    except Exception as e:
+        error_msg = f"TTS generation crashed: {type(e).__name__}: {e}"
+        logger.error(error_msg, exc_info=True)
+        return {
+            "success": False,
+            "path": None,
+            "error": error_msg,
+            "error_type": "SYSTEM_ERROR",
+            "details": {"exception": type(e).__name__, "message": str(e)},
+            "attempted_providers": [],
+            "attempted_voices": []
+        }
 
 
 # ======================================
@@ -1,19 +1,35 @@
 from moviepy.editor import (
     AudioFileClip,
-    ColorClip,
     CompositeAudioClip,
     CompositeVideoClip,
     ImageClip,
+    VideoClip,
     VideoFileClip,
 )
 from moviepy.audio.fx import all as afx
+from moviepy.config import get_setting
 from moviepy.video.compositing.concatenate import concatenate_videoclips
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
 from PIL import Image, ImageDraw, ImageFont
-import tempfile
+import numpy as np
 import os
+import json
+import hashlib
 import logging
 import subprocess
 import re
+import unicodedata
+from functools import lru_cache
+
+try:
+    from numba import njit, prange  # Optional: JIT-compiled frame compositing
+except ImportError:
+    njit = None
+
+try:
+    from fontTools.ttLib import TTFont  # Optional: cmap coverage checks
+except ImportError:
+    TTFont = None
 
 
 Image.ANTIALIAS = Image.Resampling.LANCZOS
@@ -25,6 +41,39 @@ logger = logging.getLogger(__name__)
 WIDTH = 1080
 HEIGHT = 1920
 
+# Encoder settings shared by every rendered part, so parts can be joined
+# with a stream copy
+VIDEO_WRITE_KWARGS = {
+    "fps": 24,
+    "codec": "libx264",
+    "audio_codec": "aac",
+    # x264's default "medium" preset is the main encode cost; veryfast roughly
+    # halves it for a modest size increase at the same CRF. VIDEO_PRESET=ultrafast
+    # trades more size for speed where disk/bandwidth is cheap.
+    "preset": os.getenv("VIDEO_PRESET", "veryfast"),
+    "threads": os.cpu_count(),
+    "ffmpeg_params": ["-crf", "23", "-movflags", "+faststart"],
+    # No per-frame progress bar
+    "logger": None,
+}
+
+# Background music mixed under the narration
+MUSIC_PATH = "assets/music.mp3"
+MUSIC_VOLUME = 0.08
+
+# Hardware H.264 encoders tried in order for codec="auto", with the settings
+# that replace x264's preset/CRF. Each is checked with a tiny test encode first.
+HW_ENCODERS = {
+    "h264_nvenc": {
+        "preset": "p4",
+        "ffmpeg_params": ["-rc", "vbr", "-cq", "23", "-b:v", "6M", "-pix_fmt", "yuv420p"],
+    },
+    "h264_videotoolbox": {
+        "preset": "medium",  # Not used by videotoolbox; MoviePy always passes a preset
+        "ffmpeg_params": ["-b:v", "6M", "-pix_fmt", "yuv420p"],
+    },
+}
+
 VIDEOS_DIR = "videos"
 VIDEO_MANIFEST = os.path.join(VIDEOS_DIR, "manifest.json")
 
@@ -35,8 +84,13 @@ COLOR_TEXT_WHITE = (255, 255, 255)
 COLOR_SHADOW = (0, 0, 0)
 COLOR_OVERLAY_BG = (0, 0, 0)
 
+# Fonts shipped with the deployment are tried first, so the lookup never
+# depends on the host's fonts or on fc-list
+BUNDLED_FONT_DIR = os.path.join("assets", "fonts")
+
 # Try to find fonts on common Linux locations
 FONT_PATHS = [
+    os.path.join(BUNDLED_FONT_DIR, "DejaVuSans.ttf"),
     "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
     "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
     "/data/data/com.termux/files/usr/share/fonts/TTF/DejaVuSans.ttf",
@@ -49,6 +103,7 @@ FONT_PATHS = [
 
 # Gujarati and Indian script fonts
 INDIC_FONT_PATHS = [
+    os.path.join(BUNDLED_FONT_DIR, "NotoSansGujarati-Regular.ttf"),
     "/usr/share/fonts/truetype/droid/DroidSansFallbackFull.ttf",
     "/usr/share/fonts/truetype/noto/NotoSansMono-Regular.ttf",
     "/usr/share/fonts/truetype/droid/DroidSans.ttf",
@@ -68,6 +123,66 @@ LANGUAGE_FONT_MAP = {
     "default": FONT_PATHS
 }
 
+# fc-list output cached across processes, invalidated when a font directory changes
+FONT_LIST_CACHE = os.getenv(
+    "FONT_LIST_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "grahakchetna", "fonts.json"),
+)
+FONT_DIRS = [
+    "/usr/share/fonts",
+    "/usr/local/share/fonts",
+    os.path.expanduser("~/.local/share/fonts"),
+    os.path.expanduser("~/.fonts"),
+]
+
+
+def _font_dirs_signature():
+    """Modification times of the font directories and all their subdirectories.
+
+    Installing a font into an existing subdirectory (e.g. truetype/noto/) only
+    touches that subdirectory, so the whole tree is walked.
+    """
+    signature = {}
+    for font_dir in FONT_DIRS:
+        for root, _, _ in os.walk(font_dir):
+            try:
+                signature[root] = os.stat(root).st_mtime
+            except OSError:
+                pass
+    return signature
+
+
+@lru_cache(maxsize=1)
+def _fc_list_files():
+    """List installed font files via fc-list (raises if unavailable).
+
+    The result is stored in FONT_LIST_CACHE so later processes skip fc-list
+    until a font directory changes.
+    """
+    signature = _font_dirs_signature()
+    try:
+        with open(FONT_LIST_CACHE, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("signature") == signature:
+            return tuple(cached["files"])
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    fc_list = subprocess.check_output(["fc-list", "--format", "%{file}\n"]).decode(errors="ignore")
+    files = tuple(font_file.strip() for font_file in fc_list.splitlines() if font_file.strip())
+
+    try:
+        os.makedirs(os.path.dirname(FONT_LIST_CACHE), exist_ok=True)
+        tmp_path = f"{FONT_LIST_CACHE}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"signature": signature, "files": files}, f)
+        os.replace(tmp_path, FONT_LIST_CACHE)
+    except OSError as e:
+        logger.debug("Could not write font list cache: %s", e)
+    return files
+
+
+@lru_cache(maxsize=None)
 def get_font(bold=False, language="default"):
     """Get available font, fallback to default if not found"""
     # Try configured paths first
@@ -78,8 +193,7 @@ def get_font(bold=False, language="default"):
 
     # If not found, try system font listing via fc-list (if available)
     try:
-        fc_list = subprocess.check_output(["fc-list", "--format", "%{file}\n"]).decode(errors="ignore")
-        lines = [font_file.strip() for font_file in fc_list.splitlines() if font_file.strip()]
+        lines = _fc_list_files()
 
         # Language-specific keywords to look for in font file paths
         keywords = []
@@ -104,56 +218,460 @@ def get_font(bold=False, language="default"):
     return None  # Use default PIL font if no font file found
 
 
-def _find_working_font_for_text(text: str, fontsize: int, candidate_paths=None):
-    """Try candidate font files and return the first ImageFont that can render `text` without encoding errors."""
-    if candidate_paths is None:
-        candidate_paths = FONT_PATHS + INDIC_FONT_PATHS
+@lru_cache(maxsize=64)
+def _open_truetype(font_path, fontsize, basic_layout=False):
+    """Parse a TTF once per (path, size, layout); raises if the file can't be loaded.
+
+    basic_layout skips complex-script shaping (raqm), which ASCII text never needs.
+    """
+    if basic_layout:
+        return ImageFont.truetype(font_path, fontsize, layout_engine=ImageFont.Layout.BASIC)
+    return ImageFont.truetype(font_path, fontsize)
+
 
-    # include runtime scan of /usr/share/fonts for additional ttf files
+def _load_font(font_path, fontsize, basic_layout=False):
+    """Cached TTF font for (path, size); falls back to PIL's default font."""
+    try:
+        if font_path:
+            return _open_truetype(font_path, fontsize, basic_layout)
+    except Exception:
+        pass
+    return ImageFont.load_default()
+
+
+@lru_cache(maxsize=16)
+def _font_codepoints(font_path):
+    """Code points in a font's cmap, or None when fontTools is missing or the file can't be read."""
+    if TTFont is None or not font_path:
+        return None
+    try:
+        return frozenset(TTFont(font_path, lazy=True).getBestCmap())
+    except Exception:
+        return None
+
+
+def _font_covers(font_path, text):
+    """True when the font has a glyph for every non-space character of text.
+
+    False also means "unknown" (no fontTools), so callers keep probing as before.
+    """
+    codepoints = _font_codepoints(font_path)
+    if codepoints is None:
+        return False
+    return all(ch.isspace() or ord(ch) in codepoints for ch in text)
+
+
+@lru_cache(maxsize=1)
+def _scanned_font_files():
+    """TTF/OTF files under the system font directories, walked once per process."""
+    found = []
     for root in ("/usr/share/fonts", "/usr/local/share/fonts", "/usr/share/fonts/truetype"):
         try:
             for dirpath, dirnames, filenames in os.walk(root):
                 for fn in filenames:
                     if fn.lower().endswith((".ttf", ".otf")):
-                        candidate_paths.append(os.path.join(dirpath, fn))
+                        found.append(os.path.join(dirpath, fn))
         except Exception:
             continue
+    return tuple(found)
+
 
+def _text_script(text):
+    """Unicode script of the first non-ASCII character (e.g. "GUJARATI"), or "LATIN"."""
+    for ch in text:
+        if not ch.isascii():
+            try:
+                return unicodedata.name(ch).split(" ")[0]
+            except ValueError:
+                return "UNKNOWN"
+    return "LATIN"
+
+
+# (script, fontsize, candidates) -> ImageFont or None
+_WORKING_FONTS = {}
+
+
+def _find_working_font_for_text(text: str, fontsize: int, candidate_paths=None):
+    """Try candidate font files and return the first ImageFont that can render `text` without encoding errors.
+
+    The result is remembered per script and size, so later text in the same
+    script reuses the font without probing files again.
+    """
+    if candidate_paths is None:
+        candidate_paths = FONT_PATHS + INDIC_FONT_PATHS
+
+    key = (_text_script(text), fontsize, tuple(candidate_paths))
+    if key in _WORKING_FONTS:
+        return _WORKING_FONTS[key]
+
+    found = None
     seen = set()
-    for path in candidate_paths:
+    # include the system font directories for additional ttf files
+    for path in (*candidate_paths, *_scanned_font_files()):
         if not path or path in seen:
             continue
         seen.add(path)
         try:
             if not os.path.exists(path):
                 continue
-            f = ImageFont.truetype(path, fontsize)
+            f = _open_truetype(path, fontsize)
             # quick test: try to get bbox or mask for the text
             try:
                 f.getbbox(text)
-                return f
+                found = f
+                break
             except Exception:
                 try:
                     f.getmask(text)
-                    return f
+                    found = f
+                    break
                 except Exception:
                     continue
         except Exception:
             continue
 
-    return None
+    _WORKING_FONTS[key] = found
+    return found
 
 FONT_REGULAR = get_font(bold=False)
 FONT_BOLD = get_font(bold=True)
 FONT_GUJARATI = get_font(bold=False, language="gujarati")
 FONT_GUJARATI_BOLD = get_font(bold=True, language="gujarati")
 
+# Resized assets persisted between runs, named by (path, mtime, size)
+ASSET_CACHE_DIR = os.getenv("ASSET_CACHE_DIR", os.path.join(".cache", "assets"))
+
+
+@lru_cache(maxsize=16)
+def _load_scaled_image(path, mtime, width=None, height=None):
+    """Decode and resize an image asset; keyed on mtime so edited files reload.
+
+    The resized image is also written to ASSET_CACHE_DIR, so later processes
+    decode the small copy instead of resizing the original again.
+    """
+    key = hashlib.sha1(f"{os.path.abspath(path)}|{mtime}|{width}|{height}".encode()).hexdigest()
+    cache_path = os.path.join(ASSET_CACHE_DIR, f"{key}.png")
+    try:
+        img = Image.open(cache_path)
+        img.load()
+        return img
+    except (OSError, ValueError):
+        pass
+
+    img = Image.open(path)
+    has_alpha = "A" in img.getbands() or "transparency" in img.info
+    img = img.convert("RGBA" if has_alpha else "RGB")
+    if width is None:
+        width = int(img.width * height / img.height)
+    img = img.resize((width, height), Image.LANCZOS)
+
+    try:
+        os.makedirs(ASSET_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        # Low compression: the copy is written once and decoded on every start
+        img.save(tmp_path, format="PNG", compress_level=1)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug("Could not cache resized asset %s: %s", path, e)
+    return img
+
+
+def _scaled_asset(path, width=None, height=None):
+    """Cached copy of an image asset resized to (width, height).
+
+    With only height given the aspect ratio is kept. The returned image is
+    shared between calls and must not be modified.
+    """
+    return _load_scaled_image(path, os.path.getmtime(path), width, height)
+
+
+def _load_background_video(duration):
+    """Open assets/bg.mp4 scaled to the frame size by ffmpeg while decoding.
+
+    target_resolution makes the reader scale with libswscale, instead of
+    MoviePy resizing every decoded frame with PIL.
+    """
+    return VideoFileClip(
+        "assets/bg.mp4",
+        target_resolution=(HEIGHT, WIDTH),
+        resize_algorithm="lanczos",
+    ).subclip(0, duration)
+
+
+def _ticker_offsets(start_x, distance, duration):
+    """Integer x offset of a right-to-left ticker for every output frame."""
+    fps = VIDEO_WRITE_KWARGS["fps"]
+    n_frames = int(duration * fps) + 1
+    t = np.arange(n_frames) / fps
+    return (start_x - (t % duration) * (distance / duration)).astype(np.int32).tolist()
+
+
+def _ticker_position(start_x, distance, y, duration):
+    """Position function for a right-to-left ticker, looked up per frame.
+
+    The x offsets for every output frame are computed once up front, so the
+    per-frame callback is a list index instead of float arithmetic.
+    """
+    fps = VIDEO_WRITE_KWARGS["fps"]
+    xs = _ticker_offsets(start_x, distance, duration)
+    last = len(xs) - 1
+
+    def position(t):
+        return (xs[min(int(round(t * fps)), last)], y)
+
+    return position
+
+
+def _ticker_strip(overlay_rgba, text_arr, y, start_x, distance, duration):
+    """Opaque full-width ticker clip sliced from a pre-rendered strip, or None.
+
+    When the baked overlay behind the ticker rows is opaque and the same in
+    every column (a solid bar), the text is composited onto the bar once and
+    each frame is a WIDTH-wide slice of that strip. This replaces a masked
+    blend of a moving sprite with a plain opaque blit.
+    """
+    h, w = text_arr.shape[:2]
+    width = overlay_rgba.shape[1]
+    if y < 0 or y + h > overlay_rgba.shape[0]:
+        return None
+    band = overlay_rgba[y:y + h]
+    if (band[:, :, 3] != 255).any() or (band != band[:, :1]).any():
+        return None
+
+    # Bar | text | bar: the text's left edge sits at strip column `width`
+    strip = Image.fromarray(np.repeat(band[:, :1], 2 * width + w, axis=1))
+    strip.alpha_composite(Image.fromarray(text_arr), dest=(width, 0))
+    strip = np.array(strip.convert("RGB"))
+
+    fps = VIDEO_WRITE_KWARGS["fps"]
+    xs = _ticker_offsets(start_x, distance, duration)
+    last = len(xs) - 1
+    max_start = width + w  # From here on the window shows only the bar
+
+    def make_frame(t):
+        start = min(width - xs[min(int(round(t * fps)), last)], max_start)
+        return strip[:, start:start + width]
+
+    return VideoClip(make_frame=make_frame, duration=duration).set_position((0, y))
+
+
+def _solid_layer(size, color, opacity=1.0):
+    """RGBA image equivalent to ColorClip(size, color).set_opacity(opacity)."""
+    return Image.new("RGBA", size, (*color, int(round(255 * opacity))))
+
+
+def _bake_static_layers(layers, size):
+    """Flatten static (image, (x, y)) layers, bottom first, into one RGBA array.
+
+    Layers that never change over the video are composited once here instead
+    of being re-blended by CompositeVideoClip on every frame.
+    """
+    canvas = Image.new("RGBA", size, (0, 0, 0, 0))
+    for layer, (x, y) in layers:
+        canvas.alpha_composite(layer, dest=(int(x), int(y)))
+    return np.array(canvas)
+
+
+@lru_cache(maxsize=None)
+def _encoder_works(codec):
+    """Check with a tiny test encode that ffmpeg can actually use a hardware encoder here."""
+    settings = HW_ENCODERS[codec]
+    cmd = [
+        get_setting("FFMPEG_BINARY"), "-hide_banner", "-loglevel", "error",
+        "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.2",
+        "-vcodec", codec, "-preset", settings["preset"], *settings["ffmpeg_params"],
+        "-f", "null", "-",
+    ]
+    try:
+        subprocess.run(cmd, check=True, capture_output=True, timeout=30)
+        return True
+    except (subprocess.SubprocessError, OSError):
+        return False
+
+
+def _video_write_kwargs(codec="auto"):
+    """write_videofile settings for codec; "auto" uses a working hardware encoder, else libx264."""
+    if codec == "auto":
+        codec = next((hw for hw in HW_ENCODERS if _encoder_works(hw)), "libx264")
+
+    if codec not in HW_ENCODERS:
+        return {**VIDEO_WRITE_KWARGS, "codec": codec}
+
+    settings = HW_ENCODERS[codec]
+    return {
+        **VIDEO_WRITE_KWARGS,
+        "codec": codec,
+        "preset": settings["preset"],
+        "ffmpeg_params": [*settings["ffmpeg_params"], "-movflags", "+faststart"],
+    }
+
+
+def _background_mix(voice, duration):
+    """Narration over looped background music as a MoviePy audio clip."""
+    music_clip = AudioFileClip(MUSIC_PATH)
+
+    if music_clip.duration < duration:
+        music = afx.audio_loop(music_clip, duration=duration)
+    else:
+        music = music_clip.subclip(0, duration)
+
+    return CompositeAudioClip([music.volumex(MUSIC_VOLUME), voice])
+
+
+def _concat_with_audio(paths, audio_path, duration, output_path):
+    """Join silent video parts with a stream copy and mix the soundtrack in ffmpeg.
+
+    The narration (cut to duration) is mixed with the background music looped
+    to the same length, then padded with silence to the end of the video.
+    Only the audio is encoded; the video parts need identical encoder settings.
+    """
+    list_path = f"{os.path.splitext(output_path)[0]}.concat.txt"
+    with open(list_path, "w") as f:
+        for path in paths:
+            escaped = os.path.abspath(path).replace("'", "'\\''")
+            f.write(f"file '{escaped}'\n")
+
+    # amix scales each of its 2 inputs by 1/2; volume=2 restores a plain sum
+    audio_graph = (
+        f"[2:a]volume={MUSIC_VOLUME}[music];"
+        "[1:a][music]amix=inputs=2:duration=longest,volume=2,apad[aout]"
+    )
+    try:
+        subprocess.run(
+            [get_setting("FFMPEG_BINARY"), "-y", "-loglevel", "error",
+             "-f", "concat", "-safe", "0", "-i", list_path,
+             "-t", f"{duration:.3f}", "-i", audio_path,
+             "-stream_loop", "-1", "-t", f"{duration:.3f}", "-i", MUSIC_PATH,
+             "-filter_complex", audio_graph,
+             "-map", "0:v", "-map", "[aout]",
+             "-c:v", "copy", "-c:a", "aac", "-shortest",
+             "-movflags", "+faststart", output_path],
+            check=True,
+            capture_output=True,
+        )
+    finally:
+        os.remove(list_path)
+
+
+def _premultiply(overlay_rgba):
+    """Split an RGBA overlay into (color * alpha, 255 - alpha) as uint16 planes.
+
+    The inverse alpha is repeated per channel so both planes line up
+    element-for-element with an RGB frame.
+    """
+    alpha = np.repeat(overlay_rgba[:, :, 3:4].astype(np.uint16), 3, axis=2)
+    return overlay_rgba[:, :, :3].astype(np.uint16) * alpha, 255 - alpha
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, boundscheck=False, cache=True)
+    def _blend_over_kernel(frame, premul, inv_alpha, out):
+        # Each row is one flat run of width * 3 values with no per-pixel
+        # branches, so LLVM can vectorize the inner loop
+        height = frame.shape[0]
+        row_len = frame.shape[1] * frame.shape[2]
+        frame_rows = frame.reshape(height, row_len)
+        premul_rows = premul.reshape(height, row_len)
+        inv_rows = inv_alpha.reshape(height, row_len)
+        out_rows = out.reshape(height, row_len)
+        for y in prange(height):
+            for i in range(row_len):
+                v = np.uint32(frame_rows[y, i]) * inv_rows[y, i] + premul_rows[y, i] + 128
+                out_rows[y, i] = (v + (v >> 8)) >> 8
+
+
+def _blend_over(frame, premul, inv_alpha):
+    """Alpha-blend a premultiplied overlay onto an RGB uint8 frame in one pass.
+
+    Integer math with exact rounding of x / 255; uses the Numba kernel when
+    numba is installed.
+    """
+    if njit is not None:
+        frame = np.ascontiguousarray(frame)
+        out = np.empty_like(frame)
+        _blend_over_kernel(frame, premul, inv_alpha, out)
+        return out
+    v = frame.astype(np.uint16) * inv_alpha
+    v += premul
+    v += 128
+    v += v >> 8
+    v >>= 8
+    return v.astype(np.uint8)
+
+
+def _fuse_background(bg, overlay_rgba, duration):
+    """Composite the static overlay onto bg once per frame as a single opaque clip.
+
+    Replaces MoviePy's float mask blend of a full-frame overlay. A still
+    background is blended only once.
+    """
+    premul, inv_alpha = _premultiply(overlay_rgba)
+
+    if isinstance(bg, ImageClip):
+        frame = bg.get_frame(0)
+        if bg.mask is not None:
+            # Transparent background pixels composite over black
+            frame = (frame * bg.mask.get_frame(0)[:, :, None]).astype(np.uint8)
+        return ImageClip(_blend_over(frame, premul, inv_alpha)).set_duration(duration)
+
+    return VideoClip(
+        make_frame=lambda t: _blend_over(bg.get_frame(t), premul, inv_alpha),
+        duration=duration,
+    )
+
+
+def _wrap_text(text, font, max_width, fontsize):
+    """Greedy word wrap measuring each distinct word once and summing advance widths."""
+    try:
+        space_width = font.getlength(" ")
+    except Exception:
+        space_width = fontsize * 0.6
+
+    lines = []
+    current_words = []
+    current_width = 0
+    # Repeated words ("the", "of", "and") are measured once per text
+    word_widths = {}
+    for word in text.split():
+        word_width = word_widths.get(word)
+        if word_width is None:
+            try:
+                word_width = font.getlength(word)
+            except Exception:
+                # fallback estimate if font can't render this text
+                word_width = len(word) * fontsize * 0.6
+            word_widths[word] = word_width
+
+        if current_words and current_width + space_width + word_width > max_width:
+            lines.append(" ".join(current_words))
+            current_words = [word]
+            current_width = word_width
+        else:
+            current_width += (space_width if current_words else 0) + word_width
+            current_words.append(word)
+
+    if current_words:
+        lines.append(" ".join(current_words))
+    return lines
+
+
+def _frozen(img):
+    """Array of a rendered text image, read-only because it's shared from the cache."""
+    arr = np.array(img)
+    arr.flags.writeable = False
+    return arr
+
+
 def add_text_shadow(draw, text, position, font, shadow_offset=3):
     """Helper to add text shadow for better readability"""
     x, y = position
     # Draw shadow
     draw.text((x + shadow_offset, y + shadow_offset), text, font=font, fill=(*COLOR_SHADOW, 200))
 
+# Text images are cached per argument set, so labels repeated in every video
+# ("AI Generated Anchor", the promo ticker, ending credits) render once per
+# process. Colors must be passed as tuples; callers must not modify the result.
+@lru_cache(maxsize=16)
 def create_boxed_text_image(text, fontsize=40, color=(255, 255, 255), bold=True, box_width=600, box_height=1100, language="en"):
     """Create a text image clipped to a fixed box size (600×1100) with visible border.
     
@@ -165,40 +683,19 @@ def create_boxed_text_image(text, fontsize=40, color=(255, 255, 255), bold=True,
     else:
         font_path = FONT_BOLD if bold else FONT_REGULAR
     
-    try:
-        if font_path:
-            font = ImageFont.truetype(font_path, fontsize)
-        else:
-            font = ImageFont.load_default()
-    except Exception:
-        font = ImageFont.load_default()
+    font = _load_font(font_path, fontsize)
 
     # Ensure font can render text
-    try:
-        font.getbbox(text)
-    except Exception:
-        found = _find_working_font_for_text(text, fontsize)
-        if found:
-            font = found
+    if not _font_covers(font_path, text):
+        try:
+            font.getbbox(text)
+        except Exception:
+            found = _find_working_font_for_text(text, fontsize)
+            if found:
+                font = found
     
     # Wrap text to fit within box_width
-    lines = []
-    words = text.split()
-    current_line = ""
-    
-    for word in words:
-        test_line = current_line + word + " "
-        bbox = font.getbbox(test_line)
-        line_width = bbox[2] - bbox[0]
-        
-        if line_width > box_width - 40 and current_line:
-            lines.append(current_line.strip())
-            current_line = word + " "
-        else:
-            current_line = test_line
-    
-    if current_line:
-        lines.append(current_line.strip())
+    lines = _wrap_text(text, font, box_width - 40, fontsize)
     
     # Calculate actual height needed
     line_height = fontsize + 10
@@ -222,14 +719,10 @@ def create_boxed_text_image(text, fontsize=40, color=(255, 255, 255), bold=True,
         draw.text((10, y), line, font=font, fill=(*color, 255))
         y += line_height
     
-    # Save to temp file
-    temp_file = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
-    img.save(temp_file.name)
-    temp_file.close()
-    
-    return temp_file.name, img_height
+    return _frozen(img), img_height
 
 
+@lru_cache(maxsize=128)
 def create_text_image(text, fontsize=65, color=(255, 255, 255), bold=False, max_width=620, language="en", add_shadow=True):
     """Create text image using PIL instead of ImageMagick with optional shadow"""
     if language in ["gujarati", "hindi"]:
@@ -237,16 +730,10 @@ def create_text_image(text, fontsize=65, color=(255, 255, 255), bold=False, max_
     else:
         font_path = FONT_BOLD if bold else FONT_REGULAR
     
-    try:
-        if font_path:
-            font = ImageFont.truetype(font_path, fontsize)
-        else:
-            font = ImageFont.load_default()
-    except Exception:
-        font = ImageFont.load_default()
+    font = _load_font(font_path, fontsize)
     
     # For Gujarati/Hindi, try to find working font if default fails
-    if language in ["gujarati", "hindi"]:
+    if language in ["gujarati", "hindi"] and not _font_covers(font_path, text):
         try:
             test_char = text[0] if text else "\u0aa0"  # test gujarati char
             font.getbbox(test_char)
@@ -254,27 +741,7 @@ def create_text_image(text, fontsize=65, color=(255, 255, 255), bold=False, max_
             working_font = _find_working_font_for_text(text, fontsize, INDIC_FONT_PATHS + FONT_PATHS)
             if working_font:
                 font = working_font
-    lines = []
-    words = text.split()
-    current_line = ""
-    
-    for word in words:
-        test_line = current_line + word + " "
-        try:
-            bbox = font.getbbox(test_line)
-            line_width = bbox[2] - bbox[0]
-        except Exception:
-            # fallback estimate if font can't render this text
-            line_width = len(test_line) * fontsize * 0.6
-        
-        if line_width > max_width and current_line:
-            lines.append(current_line.strip())
-            current_line = word + " "
-        else:
-            current_line = test_line
-    
-    if current_line:
-        lines.append(current_line.strip())
+    lines = _wrap_text(text, font, max_width, fontsize)
 
     
     # Calculate image size with proper spacing
@@ -295,17 +762,13 @@ def create_text_image(text, fontsize=65, color=(255, 255, 255), bold=False, max_
                 draw.text((10 + shadow_offset, y + shadow_offset), line, font=font, fill=(*COLOR_SHADOW, 180))
             draw.text((10, y), line, font=font, fill=(*color, 255))
         except Exception as e:
-            logger.warning(f"Failed to draw line in create_text_image: {e}")
+            logger.warning("Failed to draw line in create_text_image: %s", e)
         y += line_height
     
-    # Save to temp file
-    temp_file = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
-    img.save(temp_file.name)
-    temp_file.close()
-    
-    return temp_file.name, img_height
+    return _frozen(img), img_height
 
 
+@lru_cache(maxsize=128)
 def create_ticker_text_image(text, fontsize=50, color=(255, 255, 255), bold=True, language="en"):
     """Create a single-line text image for ticker scrolling with shadow"""
     if language in ["gujarati", "hindi"]:
@@ -313,30 +776,25 @@ def create_ticker_text_image(text, fontsize=50, color=(255, 255, 255), bold=True
     else:
         font_path = FONT_BOLD if bold else FONT_REGULAR
     
-    try:
-        if font_path:
-            font = ImageFont.truetype(font_path, fontsize)
-        else:
-            font = ImageFont.load_default()
-    except Exception:
-        font = ImageFont.load_default()
+    # Indic text needs shaping; plain ASCII can use the cheaper basic layout
+    font = _load_font(font_path, fontsize, basic_layout=text.isascii())
 
     # Ensure the font can render the provided text; if not, try to find a working font
-    try:
-        font.getbbox(text)
-    except Exception:
-        found = _find_working_font_for_text(text, fontsize)
-        if found:
-            font = found
+    if not _font_covers(font_path, text):
+        try:
+            font.getbbox(text)
+        except Exception:
+            found = _find_working_font_for_text(text, fontsize)
+            if found:
+                font = found
     
-    # Create image with extra width for scrolling (wider for long headlines)
+    # Size the image to the rendered text (20px margin each side); the
+    # scroll position doesn't depend on the image width
     img_height = fontsize + 30
-    # Use the video WIDTH to size ticker appropriately; fall back to 1200
     try:
-        base_width = max(1200, int(WIDTH * 1.2))
+        img_width = int(font.getlength(text)) + 40
     except Exception:
-        base_width = 1400
-    img_width = max(base_width, len(text) * 25)
+        img_width = len(text) * 25
     shadow_offset = 3
     
     # Create image
@@ -348,12 +806,7 @@ def create_ticker_text_image(text, fontsize=50, color=(255, 255, 255), bold=True
     # Draw text
     draw.text((20, 15), text, font=font, fill=(*color, 255))
     
-    # Save to temp file
-    temp_file = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
-    img.save(temp_file.name)
-    temp_file.close()
-    
-    return temp_file.name, img_height
+    return _frozen(img), img_height
 
 
 def split_ticker_lines(text, max_chars=70):
@@ -368,18 +821,20 @@ def split_ticker_lines(text, max_chars=70):
 
     lines = []
     for sentence in sentences:
-        words = sentence.split()
-        current = ""
-        for word in words:
-            trial = f"{current} {word}".strip()
-            if len(trial) <= max_chars:
-                current = trial
+        # Collect words and track the joined length; join once per line
+        current = []
+        current_len = 0
+        for word in sentence.split():
+            trial_len = current_len + len(word) + (1 if current else 0)
+            if trial_len <= max_chars or not current:
+                current.append(word)
+                current_len = trial_len
             else:
-                if current:
-                    lines.append(current)
-                current = word
+                lines.append(" ".join(current))
+                current = [word]
+                current_len = len(word)
         if current:
-            lines.append(current)
+            lines.append(" ".join(current))
     return lines or ["Breaking update"]
 
 
@@ -390,28 +845,23 @@ def create_right_content_box(text, fontsize=32, color=(255, 255, 255), bold=True
     Design: semi-transparent background with text centered vertically.
     Dimensions optimized for 1080x1920 (9:16) vertical format.
     
-    Returns: (image_path, width, height)
+    Returns: (RGBA image array, width, height)
     """
     if language in ["gujarati", "hindi"]:
         font_path = FONT_GUJARATI_BOLD if bold else FONT_GUJARATI
     else:
         font_path = FONT_BOLD if bold else FONT_REGULAR
     
-    try:
-        if font_path:
-            font = ImageFont.truetype(font_path, fontsize)
-        else:
-            font = ImageFont.load_default()
-    except Exception:
-        font = ImageFont.load_default()
+    font = _load_font(font_path, fontsize)
     
     # Ensure font can render text
-    try:
-        font.getbbox(text)
-    except Exception:
-        found = _find_working_font_for_text(text, fontsize)
-        if found:
-            font = found
+    if not _font_covers(font_path, text):
+        try:
+            font.getbbox(text)
+        except Exception:
+            found = _find_working_font_for_text(text, fontsize)
+            if found:
+                font = found
     
     # Right content box dimensions (optimized for 9:16 format)
     box_width = int(WIDTH * 0.45)  # 45% of screen width
@@ -419,23 +869,7 @@ def create_right_content_box(text, fontsize=32, color=(255, 255, 255), bold=True
     padding = 25
     
     # Wrap text to fit within box
-    lines = []
-    words = text.split()
-    current_line = ""
-    
-    for word in words:
-        test_line = current_line + word + " "
-        bbox = font.getbbox(test_line)
-        line_width = bbox[2] - bbox[0]
-        
-        if line_width > (box_width - padding - padding) and current_line:
-            lines.append(current_line.strip())
-            current_line = word + " "
-        else:
-            current_line = test_line
-    
-    if current_line:
-        lines.append(current_line.strip())
+    lines = _wrap_text(text, font, box_width - padding - padding, fontsize)
     
     # Calculate actual image dimensions
     line_height = fontsize + 8
@@ -466,17 +900,12 @@ def create_right_content_box(text, fontsize=32, color=(255, 255, 255), bold=True
         draw.text((padding, y), line, font=font, fill=(*color, 255))
         y += line_height
     
-    # Save to temp file
-    temp_file = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
-    img.save(temp_file.name)
-    temp_file.close()
-    
-    return temp_file.name, img_width, img_height
+    return np.array(img), img_width, img_height
 
 
 def generate_video(title, description, audio_path, language="en", use_female_anchor=True, output_path=None, max_duration=None, media_path=None, subtitle=None,
                   layout_mediaPosition="right", layout_mediaSize="medium", layout_mediaOpacity=100, 
-                  layout_textAlignment="center", layout_backgroundBlur="light"):
+                  layout_textAlignment="center", layout_backgroundBlur="light", codec="auto"):
     """Generate a video from provided audio and assets.
 
     Args:
@@ -495,6 +924,7 @@ def generate_video(title, description, audio_path, language="en", use_female_anc
         layout_mediaOpacity: Opacity of media (0-100)
         layout_textAlignment: Text alignment ('left', 'center', 'right')
         layout_backgroundBlur: Background blur effect ('none', 'light', 'medium', 'heavy')
+        codec: Video encoder ("auto" picks NVENC/VideoToolbox when usable, else libx264)
 
     Returns:
         Path to generated video file
@@ -506,12 +936,12 @@ def generate_video(title, description, audio_path, language="en", use_female_anc
     # Ensure output directory exists
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-    voice = AudioFileClip(audio_path)
+    # Only the narration length is needed here; ffmpeg reads the audio itself
+    # when muxing, so no AudioFileClip reader process is kept open.
+    duration = ffmpeg_parse_infos(audio_path)["duration"]
     # Trim audio if a maximum duration is requested
-    if max_duration and voice.duration > float(max_duration):
-        voice = voice.subclip(0, float(max_duration))
-
-    duration = voice.duration
+    if max_duration and duration > float(max_duration):
+        duration = float(max_duration)
 
     # Try to use shorts background image if available, otherwise fall back to bg.mp4
     shorts_bg_path = "shortbg.png"  # In root directory
@@ -519,70 +949,56 @@ def generate_video(title, description, audio_path, language="en", use_female_anc
     # Background
     try:
         if os.path.exists(shorts_bg_path):
-            logger.info(f"Loading shorts background: {shorts_bg_path}")
-            bg_img = ImageClip(shorts_bg_path)
-            bg = bg_img.resize((WIDTH, HEIGHT)).set_duration(duration)
+            logger.info("Loading shorts background: %s", shorts_bg_path)
+            bg_img = _scaled_asset(shorts_bg_path, WIDTH, HEIGHT)
+            bg = ImageClip(np.array(bg_img)).set_duration(duration)
             logger.info("✓ Shorts background loaded")
         else:
-            logger.warning(f"Shorts background not found: {shorts_bg_path}, using bg.mp4")
-            bg = (
-                VideoFileClip("assets/bg.mp4")
-                .resize((WIDTH, HEIGHT))
-                .subclip(0, duration)
-            )
+            logger.warning("Shorts background not found: %s, using bg.mp4", shorts_bg_path)
+            bg = _load_background_video(duration)
     except Exception as e:
-        logger.error(f"Failed to load background: {e}. Falling back to bg.mp4")
-        bg = (
-            VideoFileClip("assets/bg.mp4")
-            .resize((WIDTH, HEIGHT))
-            .subclip(0, duration)
-        )
-
-    overlay = (
-        ColorClip((WIDTH, HEIGHT), color=COLOR_OVERLAY_BG)
-        .set_opacity(0.15 if layout_backgroundBlur == "light" else (0.25 if layout_backgroundBlur == "medium" else (0.4 if layout_backgroundBlur == "heavy" else 0.08)))
-        .set_duration(duration)
+        logger.error("Failed to load background: %s. Falling back to bg.mp4", e)
+        bg = _load_background_video(duration)
+
+    # Static layers (bottom first) are baked into a single image below, so
+    # MoviePy only composites the bg and the animated clips on each frame
+    static_layers = []
+
+    # Background dim. Its strength depends on layout_backgroundBlur, so it is
+    # baked with the other static layers rather than into bg.mp4; the fused
+    # background blend applies it at no extra per-frame cost.
+    overlay = _solid_layer(
+        (WIDTH, HEIGHT),
+        COLOR_OVERLAY_BG,
+        0.15 if layout_backgroundBlur == "light" else (0.25 if layout_backgroundBlur == "medium" else (0.4 if layout_backgroundBlur == "heavy" else 0.08)),
     )
+    static_layers.append((overlay, (0, 0)))
 
     # Anchor - perfect position (left side, centered vertically)
     anchor_height = 750
     anchor_y = int((HEIGHT - anchor_height) / 2)  # Center vertically
-    anchor = (
-        ImageClip("static/anchor.png")
-        .resize(height=anchor_height)
-        .set_position((40, anchor_y))
-        .set_duration(duration)
-    )
+    anchor = _scaled_asset("static/anchor.png", height=anchor_height).convert("RGBA")
+    static_layers.append((anchor, (40, anchor_y)))
 
     # Logo - moved to right corner
-    logo = (
-        ImageClip("static/logo.jpg")
-        .resize(height=100)
-        .set_position((WIDTH - 130, 40))
-        .set_duration(duration)
-    )
+    logo = _scaled_asset("static/logo.jpg", height=100).convert("RGBA")
+    static_layers.append((logo, (WIDTH - 130, 40)))
 
     # ============= TOP RED HEADLINE BAR =============
     headline_bar_height = 120
     headline_bar_y = 150
     
     # Red background bar with gradient effect (simulated with darker red border)
-    headline_bar = (
-        ColorClip((WIDTH, headline_bar_height), color=COLOR_ACCENT_RED)
-        .set_position(("center", headline_bar_y))
-        .set_duration(duration)
-    )
+    headline_bar = _solid_layer((WIDTH, headline_bar_height), COLOR_ACCENT_RED)
+    static_layers.append((headline_bar, (0, headline_bar_y)))
     
     # Add dark red border effect (creates depth)
-    headline_bar_border = (
-        ColorClip((WIDTH, 3), color=COLOR_ACCENT_DARK_RED)
-        .set_position(("center", headline_bar_y + headline_bar_height - 3))
-        .set_duration(duration)
-    )
+    headline_bar_border = _solid_layer((WIDTH, 3), COLOR_ACCENT_DARK_RED)
+    static_layers.append((headline_bar_border, (0, headline_bar_y + headline_bar_height - 3)))
 
     # Create scrolling ticker text using headline (same variable for ticker and right box)
     headline = title  # Use headline variable consistently
-    ticker_img_path, ticker_height = create_ticker_text_image(
+    ticker_img, ticker_height = create_ticker_text_image(
         headline,
         fontsize=50,
         color=(255, 255, 255),
@@ -591,29 +1007,19 @@ def generate_video(title, description, audio_path, language="en", use_female_anc
     )
     
     # Create scrolling animation - text moves from right to left
-    ticker_clip = ImageClip(ticker_img_path).set_duration(duration)
-    
-    # Animation function for scrolling
-    def make_ticker_position(t):
-        # Speed: move across screen in duration seconds, then loop
-        scroll_speed = WIDTH + 4500  # Total distance to scroll - increased for faster speed
-        x_pos = WIDTH - (t % duration) * (scroll_speed / duration)
-        # Center ticker vertically inside the headline bar (tight)
-        y_center = int(headline_bar_y + (headline_bar_height - ticker_height) / 2)
-        return (x_pos, y_center)
+    ticker_clip = ImageClip(ticker_img).set_duration(duration)
     
-    ticker_clip = ticker_clip.set_position(make_ticker_position)
+    # Speed: move across screen in duration seconds, then loop
+    scroll_speed = WIDTH + 4500  # Total distance to scroll - increased for faster speed
+    # Center ticker vertically inside the headline bar (tight)
+    y_center = int(headline_bar_y + (headline_bar_height - ticker_height) / 2)
+    ticker_clip = ticker_clip.set_position(_ticker_position(WIDTH, scroll_speed, y_center, duration))
+    # Tickers over a solid bar become pre-rendered strips once the bar is baked
+    strip_tickers = {"ticker": (ticker_img, y_center, WIDTH, scroll_speed)}
 
     # Background behind ticker text: semi-transparent black (80% opacity)
-    try:
-        ticker_bg = (
-            ColorClip((WIDTH, ticker_height + 20), color=(0, 0, 0))
-            .set_opacity(0.8)
-            .set_position(("center", int(headline_bar_y + (headline_bar_height - (ticker_height + 20)) / 2)))
-            .set_duration(duration)
-        )
-    except Exception:
-        ticker_bg = None
+    ticker_bg = _solid_layer((WIDTH, ticker_height + 20), (0, 0, 0), 0.8)
+    static_layers.append((ticker_bg, (0, int(headline_bar_y + (headline_bar_height - (ticker_height + 20)) / 2))))
 
     # Define breaking bar Y early so right-side layout can reference it
     breaking_bar_y = HEIGHT - 220
@@ -654,12 +1060,8 @@ def generate_video(title, description, audio_path, language="en", use_female_anc
         media_box_h = 560
         text_box_h = 620
 
-        media_lane_bg = (
-            ColorClip((lane_width, media_box_h), color=(0, 0, 0))
-            .set_opacity(0.45)
-            .set_position((right_lane_x, lane_top_y))
-            .set_duration(duration)
-        )
+        media_lane_bg = _solid_layer((lane_width, media_box_h), (0, 0, 0), 0.45)
+        static_layers.append((media_lane_bg, (right_lane_x, lane_top_y)))
 
         media_visual = None
         if has_media:
@@ -680,24 +1082,23 @@ def generate_video(title, description, audio_path, language="en", use_female_anc
                 py = lane_top_y + int((media_box_h - fit_h) / 2)
                 media_visual = media_clip.set_position((px, py)).set_opacity(layout_mediaOpacity / 100.0)
             except Exception as e:
-                logger.warning(f"Failed to load short media {media_path}: {e}")
+                logger.warning("Failed to load short media %s: %s", media_path, e)
 
         if media_visual is None:
-            placeholder_img_path, _ = create_text_image(
+            placeholder_img, _ = create_text_image(
                 "Media required in this box",
                 fontsize=36,
                 color=(255, 255, 255),
                 bold=False,
                 max_width=lane_width - 30,
             )
-            media_visual = (
-                ImageClip(placeholder_img_path)
-                .set_duration(duration)
-                .set_position((right_lane_x + 15, lane_top_y + int((media_box_h - 80) / 2)))
-            )
+            static_layers.append((
+                Image.fromarray(placeholder_img),
+                (right_lane_x + 15, lane_top_y + int((media_box_h - 80) / 2)),
+            ))
 
         text_y = lane_top_y + media_box_h + lane_gap
-        desc_img_path, desc_height = create_boxed_text_image(
+        desc_img, desc_height = create_boxed_text_image(
             description,
             fontsize=40,
             color=(255, 255, 255),
@@ -707,24 +1108,14 @@ def generate_video(title, description, audio_path, language="en", use_female_anc
             language=language
         )
 
-        desc_bg_box = (
-            ColorClip((lane_width, text_box_h), color=(0, 0, 0))
-            .set_opacity(0.6 * (layout_mediaOpacity / 100.0))
-            .set_position((right_lane_x, text_y))
-            .set_duration(duration)
-        )
-        desc_border = (
-            ColorClip((lane_width, 3), color=(255, 215, 0))
-            .set_position((right_lane_x, text_y))
-            .set_duration(duration)
-        )
+        desc_bg_box = _solid_layer((lane_width, text_box_h), (0, 0, 0), 0.6 * (layout_mediaOpacity / 100.0))
+        static_layers.append((desc_bg_box, (right_lane_x, text_y)))
+        desc_border = _solid_layer((lane_width, 3), (255, 215, 0))
+        static_layers.append((desc_border, (right_lane_x, text_y)))
 
         if desc_height > text_box_h:
-            from PIL import Image as PILImage
-            import numpy as np
-            from moviepy.video.VideoClip import VideoClip
-
-            full_img = PILImage.open(desc_img_path)
+            # RGB view of the whole description; each frame is a slice of it
+            desc_rgb = desc_img[:, :lane_width, :3]
 
             def desc_make_frame(t):
                 scroll_duration = duration * 0.35
@@ -734,26 +1125,20 @@ def generate_video(title, description, audio_path, language="en", use_female_anc
                 else:
                     y_scroll = int(desc_height - text_box_h)
 
-                cropped = full_img.crop((0, y_scroll, lane_width, y_scroll + text_box_h))
-                if cropped.mode == 'RGBA':
-                    cropped = cropped.convert('RGB')
-                return np.array(cropped)
+                return desc_rgb[y_scroll:y_scroll + text_box_h]
 
             desc_clip = VideoClip(make_frame=desc_make_frame, duration=duration)
             desc_clip = desc_clip.set_position((right_lane_x, text_y))
         else:
-            desc_clip = ImageClip(desc_img_path).set_duration(duration)
-            desc_clip = desc_clip.set_position((right_lane_x, text_y))
+            # Still description joins the baked static layers
+            static_layers.append((Image.fromarray(desc_img), (right_lane_x, text_y)))
+            desc_clip = None
 
-        right_content_clip = CompositeVideoClip(
-            [media_lane_bg, media_visual, desc_bg_box, desc_border, desc_clip],
-            size=(WIDTH, HEIGHT)
-        ).set_duration(duration)
-        right_bg_box = None
+        right_content_clips = [c for c in (media_visual, desc_clip) if c is not None]
         use_text_box = False
 
     elif has_media:
-        logger.info(f"Media available: {media_path} - displaying media on right side")
+        logger.info("Media available: %s - displaying media on right side", media_path)
         try:
             # FORCE fixed long-video media lane (same as text box geometry)
             # Long: 850x550 at right side; Short keeps existing behavior.
@@ -786,19 +1171,14 @@ def generate_video(title, description, audio_path, language="en", use_female_anc
             py = lane_y + int((forced_h - fit_h) / 2)
 
             # Dark lane background (same visual behavior as text lane)
-            media_bg = (
-                ColorClip((forced_w, forced_h), color=(0, 0, 0))
-                .set_opacity(0.45)
-                .set_position((right_content_x, lane_y))
-                .set_duration(duration)
-            )
+            media_bg = _solid_layer((forced_w, forced_h), (0, 0, 0), 0.45)
 
             media_clip = media_clip.set_position((px, py)).set_opacity(layout_mediaOpacity / 100.0)
-            right_content_clip = CompositeVideoClip([media_bg, media_clip], size=(WIDTH, HEIGHT)).set_duration(duration)
-            right_bg_box = None
+            static_layers.append((media_bg, (right_content_x, lane_y)))
+            right_content_clips = [media_clip]
             use_text_box = False
         except Exception as e:
-            logger.warning(f"Failed to load media {media_path}: {e} - falling back to text box")
+            logger.warning("Failed to load media %s: %s - falling back to text box", media_path, e)
             has_media = False
             use_text_box = True
     else:
@@ -824,7 +1204,7 @@ def generate_video(title, description, audio_path, language="en", use_female_anc
             desc_box_height = 550
 
         # Create description text clipped to box
-        desc_img_path, desc_height = create_boxed_text_image(
+        desc_img, desc_height = create_boxed_text_image(
             description,
             fontsize=40,
             color=(255, 255, 255),
@@ -834,27 +1214,16 @@ def generate_video(title, description, audio_path, language="en", use_female_anc
             language=language
         )
 
-        # Background box and optional border
-        desc_bg_box = (
-            ColorClip((desc_width, desc_box_height), color=(0, 0, 0))
-            .set_opacity(0.6 * (layout_mediaOpacity / 100.0))
-            .set_position((desc_x, desc_start_y))
-            .set_duration(duration)
-        )
-
-        desc_border = (
-            ColorClip((desc_width, 3), color=(255, 215, 0))
-            .set_position((desc_x, desc_start_y))
-            .set_duration(duration)
-        )
+        # Background box
+        desc_bg_box = _solid_layer((desc_width, desc_box_height), (0, 0, 0), 0.6 * (layout_mediaOpacity / 100.0))
+        static_layers.append((desc_bg_box, (desc_x, desc_start_y)))
 
         # If text is taller than the box, create scrolling animation with masking
         if desc_height > desc_box_height:
-            logger.info(f"Description scrolling enabled (height {desc_height} > box {desc_box_height})")
-            from PIL import Image as PILImage
-            import numpy as np
+            logger.info("Description scrolling enabled (height %s > box %s)", desc_height, desc_box_height)
 
-            full_img = PILImage.open(desc_img_path)
+            # RGB view of the whole description; each frame is a slice of it
+            desc_rgb = desc_img[:, :desc_width, :3]
 
             def desc_make_frame(t):
                 scroll_duration = duration * 0.35
@@ -864,36 +1233,24 @@ def generate_video(title, description, audio_path, language="en", use_female_anc
                 else:
                     y_scroll = int(desc_height - desc_box_height)
 
-                cropped = full_img.crop((0, y_scroll, desc_width, y_scroll + desc_box_height))
-                if cropped.mode == 'RGBA':
-                    cropped = cropped.convert('RGB')
-                return np.array(cropped)
+                return desc_rgb[y_scroll:y_scroll + desc_box_height]
 
-            from moviepy.video.VideoClip import VideoClip
             desc_clip = VideoClip(make_frame=desc_make_frame, duration=duration)
             desc_clip = desc_clip.set_position((desc_x, desc_start_y))
+            right_content_clips = [desc_clip]
         else:
-            desc_clip = ImageClip(desc_img_path).set_duration(duration)
-            desc_clip = desc_clip.set_position((desc_x, desc_start_y))
-
-        # Adopt unified variable names used later in composition
-        right_content_clip = desc_clip
-        right_bg_box = desc_bg_box
+            # Still description joins the baked static layers
+            static_layers.append((Image.fromarray(desc_img), (desc_x, desc_start_y)))
+            right_content_clips = []
     
     # ============= BOTTOM BREAKING NEWS BAR =============
     # Use same headline text for ticker consistency
-    breaking_bar = (
-        ColorClip((WIDTH, 130), color=COLOR_ACCENT_RED)
-        .set_position(("center", breaking_bar_y))
-        .set_duration(duration)
-    )
+    breaking_bar = _solid_layer((WIDTH, 130), COLOR_ACCENT_RED)
+    static_layers.append((breaking_bar, (0, breaking_bar_y)))
     
     # Add dark red border for depth
-    breaking_bar_border = (
-        ColorClip((WIDTH, 3), color=COLOR_ACCENT_DARK_RED)
-        .set_position(("center", breaking_bar_y))
-        .set_duration(duration)
-    )
+    breaking_bar_border = _solid_layer((WIDTH, 3), COLOR_ACCENT_DARK_RED)
+    static_layers.append((breaking_bar_border, (0, breaking_bar_y)))
 
     # BREAKING bar ticker runs subtitle (fallback: description)
     breaking_raw = (subtitle or description or "").strip()
@@ -902,29 +1259,25 @@ def generate_video(title, description, audio_path, language="en", use_female_anc
 
     if WIDTH == 1080:
         # Short: keep scrolling ticker in breaking bar
-        breaking_text_img_path, breaking_text_height = create_ticker_text_image(
+        breaking_text_arr, breaking_text_height = create_ticker_text_image(
             breaking_raw,
             fontsize=40,
             color=(255, 255, 255),
             bold=False,
             language=language
         )
-        breaking_text_img = ImageClip(breaking_text_img_path).set_duration(duration)
+        breaking_text_img = ImageClip(breaking_text_arr).set_duration(duration)
 
-        def breaking_ticker_position(t):
-            scroll_speed = WIDTH + 4500
-            x_pos = WIDTH - (t % duration) * (scroll_speed / duration)
-            y_center = int(breaking_bar_y + (130 - breaking_text_height) / 2)
-            return (x_pos, y_center)
-
-        breaking_text = breaking_text_img.set_position(breaking_ticker_position)
+        y_center = int(breaking_bar_y + (130 - breaking_text_height) / 2)
+        breaking_text = breaking_text_img.set_position(_ticker_position(WIDTH, WIDTH + 4500, y_center, duration))
+        strip_tickers["breaking"] = (breaking_text_arr, y_center, WIDTH, WIDTH + 4500)
     else:
         # Long: show line-by-line text instead of a scrolling paragraph
         lines = split_ticker_lines(breaking_raw, max_chars=85)
         line_duration = max(2.2, duration / max(1, len(lines)))
         breaking_line_clips = []
         for idx, line in enumerate(lines):
-            line_img_path, line_h = create_text_image(
+            line_img, line_h = create_text_image(
                 line,
                 fontsize=38,
                 color=(255, 255, 255),
@@ -935,7 +1288,7 @@ def generate_video(title, description, audio_path, language="en", use_female_anc
             start_t = idx * line_duration
             visible_for = min(line_duration, max(0.1, duration - start_t))
             line_clip = (
-                ImageClip(line_img_path)
+                ImageClip(line_img)
                 .set_start(start_t)
                 .set_duration(visible_for)
                 .set_position((60, int(breaking_bar_y + (130 - line_h) / 2)))
@@ -948,18 +1301,11 @@ def generate_video(title, description, audio_path, language="en", use_female_anc
     under_breaking_bar_height = 80
     under_breaking_bar_y = breaking_bar_y + 130  # just below breaking bar
 
-    under_breaking_bar = (
-        ColorClip((WIDTH, under_breaking_bar_height), color=(20, 20, 20))
-        .set_opacity(0.95)
-        .set_position(("center", under_breaking_bar_y))
-        .set_duration(duration)
-    )
+    under_breaking_bar = _solid_layer((WIDTH, under_breaking_bar_height), (20, 20, 20), 0.95)
+    static_layers.append((under_breaking_bar, (0, under_breaking_bar_y)))
 
-    under_breaking_border = (
-        ColorClip((WIDTH, 2), color=COLOR_ACCENT_DARK_RED)
-        .set_position(("center", under_breaking_bar_y))
-        .set_duration(duration)
-    )
+    under_breaking_border = _solid_layer((WIDTH, 2), COLOR_ACCENT_DARK_RED)
+    static_layers.append((under_breaking_border, (0, under_breaking_bar_y)))
 
     promo_text = (
         "For more videos, visit our Channel - Click here to Subscribe and stay Updated - "
@@ -968,113 +1314,105 @@ def generate_video(title, description, audio_path, language="en", use_female_anc
         "Instagram : @grahak.chetna"
     )
 
-    under_text_img_path, under_text_h = create_ticker_text_image(
+    under_text_arr, under_text_h = create_ticker_text_image(
         promo_text,
         fontsize=34,
         color=(255, 255, 255),
         bold=False,
         language=language
     )
-    under_text_img = ImageClip(under_text_img_path).set_duration(duration)
-
-    def under_ticker_position(t):
-        scroll_speed = WIDTH + 3500
-        x_pos = WIDTH - (t % duration) * (scroll_speed / duration)
-        y_center = int(under_breaking_bar_y + (under_breaking_bar_height - under_text_h) / 2)
-        return (x_pos, y_center)
+    under_text_img = ImageClip(under_text_arr).set_duration(duration)
 
-    breaking_desc_text = under_text_img.set_position(under_ticker_position)
+    y_center = int(under_breaking_bar_y + (under_breaking_bar_height - under_text_h) / 2)
+    breaking_desc_text = under_text_img.set_position(_ticker_position(WIDTH, WIDTH + 3500, y_center, duration))
 
     # AI label
-    ai_label_img_path, _ = create_text_image(
+    ai_label_img, _ = create_text_image(
         "AI Generated Anchor",
         fontsize=28,
         color=(255, 255, 255),
         bold=False,
         max_width=WIDTH - 100
     )
-    ai_label = ImageClip(ai_label_img_path)
+    ai_label = ImageClip(ai_label_img)
     ai_label = (
         ai_label
         .set_position((20, HEIGHT - 60))
         .set_duration(duration)
     )
 
-    # Background music (loop safe)
-    music_clip = AudioFileClip("assets/music.mp3")
-
-    if music_clip.duration < duration:
-        music = afx.audio_loop(music_clip, duration=duration)
-    else:
-        music = music_clip.subclip(0, duration)
+    # All static layers baked into the background as one opaque clip. None of
+    # the animated clips overlap a static layer drawn above them, except the
+    # AI label, which stays on top.
+    overlay = _bake_static_layers(static_layers, (WIDTH, HEIGHT))
+    base = _fuse_background(bg, overlay, duration)
 
-    music = music.volumex(0.08)
-
-    final_audio = CompositeAudioClip([music, voice])
+    for name, args in strip_tickers.items():
+        strip = _ticker_strip(overlay, *args, duration)
+        if strip is None:
+            continue
+        if name == "ticker":
+            ticker_clip = strip
+        else:
+            breaking_text = strip
 
-    # Build clip list and filter out any None values to avoid moviepy errors
     clips = [
-        bg,
-        overlay,
-        anchor,
-        logo,
-        headline_bar,
-        headline_bar_border,
-        # Ticker background (if created) followed by ticker text
-        ticker_bg if 'ticker_bg' in locals() and ticker_bg is not None else None,
+        base,
         ticker_clip,
         # Right side content - either media or text box
-        right_bg_box if 'right_bg_box' in locals() and right_bg_box is not None else None,
-        right_content_clip,
-        breaking_bar,
-        breaking_bar_border,
+        *right_content_clips,
         breaking_text,
-        under_breaking_bar if 'under_breaking_bar' in locals() else None,
-        under_breaking_border if 'under_breaking_border' in locals() else None,
-        breaking_desc_text if 'breaking_desc_text' in locals() else None,
+        breaking_desc_text,
         ai_label,
     ]
-
-    clips = [c for c in clips if c is not None]
-    main_video = CompositeVideoClip(clips).set_audio(final_audio)
+    main_video = CompositeVideoClip(clips)
 
     # Ending screen (3 sec)
     ending_duration = 3
 
-    ending_bg = (
-        ColorClip((WIDTH, HEIGHT), color=(0, 0, 0))
-        .set_duration(ending_duration)
-    )
+    ending_bg = _solid_layer((WIDTH, HEIGHT), (0, 0, 0))
 
-    ending_text_img_path, _ = create_text_image(
+    ending_text_img, _ = create_text_image(
         "Presented by\n Hardik Gajjar, Grahak Chetna",
         fontsize=75,
         color=(255, 255, 255),
         bold=True,
         max_width=WIDTH - 100
     )
-    ending_text = ImageClip(ending_text_img_path)
-    ending_text = (
-        ending_text
-        .set_position("center")
-        .set_duration(ending_duration)
-    )
+    ending_text = Image.fromarray(ending_text_img)
+    ending_text_pos = ((WIDTH - ending_text.width) // 2, (HEIGHT - ending_text.height) // 2)
 
-    ending_clip = CompositeVideoClip(
-        [ending_bg, ending_text]
-    ).set_duration(ending_duration)
-
-    final = concatenate_videoclips([main_video, ending_clip])
+    # The ending is a still frame: bake it once, drop alpha (it is opaque)
+    ending_frame = _bake_static_layers([(ending_bg, (0, 0)), (ending_text, ending_text_pos)], (WIDTH, HEIGHT))
+    ending_clip = ImageClip(ending_frame[:, :, :3]).set_duration(ending_duration)
 
     # Use the provided output_path or default to static/final_video.mp4
     if not output_path:
         output_path = "static/final_video.mp4"
 
-    final.write_videofile(
-        output_path,
-        fps=24,
-        codec="libx264",
-        audio_codec="aac",
-    )
+    # Render the main video and the ending separately without audio, then join
+    # them with a stream copy so the main video is encoded only once. ffmpeg
+    # mixes narration and music in the same pass.
+    write_kwargs = _video_write_kwargs(codec)
+    logger.info("Encoding with %s", write_kwargs['codec'])
+
+    root, _ = os.path.splitext(output_path)
+    main_tmp = f"{root}.main.mp4"
+    ending_tmp = f"{root}.ending.mp4"
+    try:
+        main_video.write_videofile(main_tmp, audio=False, **write_kwargs)
+        ending_clip.write_videofile(ending_tmp, audio=False, **write_kwargs)
+        _concat_with_audio([main_tmp, ending_tmp], audio_path, duration, output_path)
+    except subprocess.CalledProcessError as e:
+        logger.warning("Stream-copy concat failed (%s), re-encoding", e.stderr.decode(errors='ignore').strip())
+        voice = AudioFileClip(audio_path).subclip(0, duration)
+        main_video = main_video.set_audio(_background_mix(voice, duration))
+        final = concatenate_videoclips([main_video, ending_clip])
+        final.write_videofile(output_path, **write_kwargs)
+    finally:
+        for tmp in (main_tmp, ending_tmp):
+            if os.path.exists(tmp):
+                os.remove(tmp)
 
     return output_path
+